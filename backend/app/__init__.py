@@ -12,51 +12,133 @@ Responsibilities:
   2. Initialise extensions (SQLAlchemy, Marshmallow) via init_app()
   3. Register all route blueprints under /api/v1
   4. Register global error handlers (AppError → JSON, Exception → 500)
-  5. Register a custom JSON provider to serialise Decimal as string
-     (spec: monetary amounts are transmitted as strings, never JS numbers)
+  5. Register a custom orjson-backed JSON provider that serialises Decimal
+     as string (spec: monetary amounts are transmitted as strings, never
+     JS numbers)
 
 Note on model imports:
-  All model classes are imported inside create_app() so that SQLAlchemy's
-  metadata is populated before Alembic inspects it. They are not used
-  directly here — the import side-effect is sufficient.
+  All model modules are imported by _ensure_models_loaded() (called from
+  create_app()) so that SQLAlchemy's metadata is populated before Alembic
+  inspects it. They are not used directly here — the import side-effect is
+  sufficient. Declarative registration needs no app context, and the
+  imports run once per process regardless of how many apps are created.
 """
 
 from __future__ import annotations
 
-import traceback
+import enum
+import importlib
+from datetime import date
 from decimal import Decimal
+from typing import Any, Iterable
 
-from flask import Flask, jsonify, request
-from flask.json.provider import DefaultJSONProvider
+import orjson
+from flask import Flask, Response, g, jsonify, request
+from flask.json.provider import JSONProvider
 from marshmallow import ValidationError
+from werkzeug.utils import import_string
 
+from backend.app.errors import ERROR_CODE_VALUES, AppError, ErrorCode
 from backend.config import config_by_name, validate_production_config
 
 
 # ── Custom JSON provider ───────────────────────────────────────────────────
-# Flask's default JSON encoder does not handle Decimal.
+# Flask's default JSON provider is built on the pure-Python `json` module and
+# does not handle Decimal. orjson encodes natively (Rust) and already handles
+# datetime, enum and int-keyed dicts; Decimal is routed through _orjson_default.
 # All monetary amounts are serialised as strings to preserve precision and
 # match the spec's requirement that amounts are never JS number types.
 
-class DecimalJSONProvider(DefaultJSONProvider):
+def _orjson_default(o: Any) -> Any:
     """
-    Extends Flask's default JSON provider to serialise Decimal as str.
+    Fallback for types orjson cannot encode natively.
 
-    Registered on the Flask app so that jsonify() and flask.json.dumps()
-    automatically produce string amounts.
+    Decimal → str (spec: amounts are strings). datetime, date and enum
+    members are normally handled by orjson itself; they are listed here so
+    subclasses orjson declines still serialise the same way.
+    """
+    if isinstance(o, Decimal):
+        return str(o)
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, enum.Enum):
+        return o.value
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    orjson-backed JSON provider that serialises Decimal as str.
+
+    Registered on the Flask app so that jsonify(), request.get_json() and
+    flask.json.dumps()/loads() all go through orjson.
+
+    Output is always compact and keys keep insertion order, so the
+    JSON_SORT_KEYS / pretty-print knobs of the default provider do not apply.
 
     Example: Decimal("10.50") → "10.50" (not 10.5 or 10.500000001)
     """
 
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return str(o)
-        return super().default(o)
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return _orjson_dumps(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Backs jsonify(). orjson already produces UTF-8 bytes, so the body is
+        handed to the response as-is instead of via dumps()'s str round trip.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_orjson_dumps(obj), mimetype="application/json")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    return orjson.dumps(
+        obj,
+        default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS,
+    )
+
+
+# ── Model registration ─────────────────────────────────────────────────────
+
+_MODEL_MODULES: tuple[str, ...] = (
+    "backend.app.models.expense",
+    "backend.app.models.group",
+    "backend.app.models.membership",
+    "backend.app.models.refresh_token",
+    "backend.app.models.settlement",
+    "backend.app.models.split",
+    "backend.app.models.user",
+)
+
+_MODELS_LOADED = False
+
+
+def _ensure_models_loaded() -> None:
+    """
+    Imports every model module so SQLAlchemy's MetaData is populated.
+
+    Alembic needs to see these to auto-generate migrations. Runs the
+    imports at most once per process; later create_app() calls return
+    immediately.
+    """
+    global _MODELS_LOADED
+    if _MODELS_LOADED:
+        return
+    for module_name in _MODEL_MODULES:
+        importlib.import_module(module_name)
+    _MODELS_LOADED = True
 
 
 # ── Application factory ────────────────────────────────────────────────────
 
-def create_app(config_name: str = "development") -> Flask:
+def create_app(
+        config_name: str = "development",
+        blueprints: Iterable[str] | None = None,
+) -> Flask:
     """
     Creates and returns a configured Flask application instance.
 
@@ -64,13 +146,17 @@ def create_app(config_name: str = "development") -> Flask:
         config_name: One of "development", "testing", "production".
                      Resolved via config_by_name in config.py.
                      Defaults to "development".
+        blueprints:  Optional subset of blueprint names to register
+                     (keys of _BLUEPRINTS, e.g. ["auth", "groups"]).
+                     None registers every blueprint. Route modules that are
+                     not selected are never imported.
 
     Returns:
         A fully configured Flask app ready to serve requests.
     """
     app = Flask(__name__)
-    app.json_provider_class = DecimalJSONProvider
-    app.json = DecimalJSONProvider(app)
+    # Replaces the default provider instance Flask built in __init__.
+    app.json = OrjsonProvider(app)
 
     # ── Configuration ──────────────────────────────────────────────────────
     config_class = config_by_name.get(config_name, config_by_name["development"])
@@ -79,30 +165,46 @@ def create_app(config_name: str = "development") -> Flask:
     if config_name == "production":
         validate_production_config(app)  # raises ValueError if misconfigured
 
+    # JWT verification parameters, resolved once so @require_auth reads a
+    # single cached tuple instead of two config lookups per request.
+    # Key and shape are owned by middleware/auth_middleware.py.
+    app.extensions["_jwt_params"] = (
+        app.config["JWT_SECRET_KEY"],
+        [app.config.get("JWT_ALGORITHM", "HS256")],
+    )
+    # Token issuance parameters, same idea for auth_service:
+    # (secret, algorithm, access TTL, refresh TTL).
+    app.extensions["_jwt_issue_params"] = (
+        app.config["JWT_SECRET_KEY"],
+        app.config.get("JWT_ALGORITHM", "HS256"),
+        app.config["JWT_ACCESS_TOKEN_EXPIRES"],
+        app.config["JWT_REFRESH_TOKEN_EXPIRES"],
+    )
+
     # ── Extensions ─────────────────────────────────────────────────────────
     # Import here (not at module top) to avoid circular imports.
     from backend.app.extensions import db, ma
     db.init_app(app)
     ma.init_app(app)
 
+    # Resolve the scoped session once per request. Routes use g.db_session
+    # rather than going back through the db.session registry on every call;
+    # Flask-SQLAlchemy still removes the session at app-context teardown.
+    # CORS preflights are answered by Flask's automatic OPTIONS response
+    # without reaching the view or its @require_auth, so they skip this too.
+    @app.before_request
+    def _bind_db_session() -> None:
+        if request.method == "OPTIONS":
+            return
+        g.db_session = db.session()
+
     # ── Model registration ─────────────────────────────────────────────────
-    # Import all models so that SQLAlchemy's MetaData is populated.
-    # Alembic needs to see these to auto-generate migrations.
-    # The imports are intentionally unused by name — side effect is the point.
-    with app.app_context():
-        from backend.app.models import (  # noqa: F401
-            expense,
-            group,
-            membership,
-            refresh_token,
-            settlement,
-            split,
-            user,
-        )
+    # Populates SQLAlchemy's MetaData; no app context required.
+    _ensure_models_loaded()
 
     # ── Blueprints ─────────────────────────────────────────────────────────
     # All routes are prefixed with /api/v1 (spec Section 8).
-    _register_blueprints(app)
+    _register_blueprints(app, blueprints)
 
     # ── Error handlers ─────────────────────────────────────────────────────
     _register_error_handlers(app)
@@ -111,30 +213,41 @@ def create_app(config_name: str = "development") -> Flask:
     return app
 
 
-def _register_blueprints(app: Flask) -> None:
+# Blueprint registry: name → (import path, url_prefix).
+# Import paths are resolved with werkzeug's import_string() only when the
+# blueprint is actually registered, so a partial app never imports the
+# route modules (and their schemas/services) it does not serve.
+_BLUEPRINTS: dict[str, tuple[str, str]] = {
+    "auth":        ("backend.app.routes.auth:auth_bp",               "/api/v1/auth"),
+    "groups":      ("backend.app.routes.groups:groups_bp",           "/api/v1/groups"),
+    # expenses_bp is registered at /api/v1 (not /api/v1/expenses) because it
+    # owns BOTH /groups/<id>/expenses (create/list) AND /expenses/<id> (get/patch/delete).
+    # Registering at /api/v1/expenses would break the group-scoped paths.
+    "expenses":    ("backend.app.routes.expenses:expenses_bp",       "/api/v1"),
+    "balances":    ("backend.app.routes.balances:balances_bp",       "/api/v1/groups"),
+    "settlements": ("backend.app.routes.settlements:settlements_bp", "/api/v1/groups"),
+    "users":       ("backend.app.routes.users:users_bp",             "/api/v1/users"),
+}
+
+
+def _register_blueprints(app: Flask, names: Iterable[str] | None = None) -> None:
     """
-    Registers all route blueprints under the /api/v1 prefix.
+    Registers route blueprints under the /api/v1 prefix.
 
     Blueprint names match the route files in app/routes/.
     The url_prefix is set here so individual route files only specify
     the path relative to their resource (e.g. "/" and "/<int:id>").
+
+    Flask does not allow blueprints to be added after the first request,
+    so registration stays in the factory; only the module imports are
+    deferred to this point and skipped for blueprints not in `names`.
+
+    Raises KeyError if `names` contains an unknown blueprint name.
     """
-    from backend.app.routes.auth import auth_bp
-    from backend.app.routes.balances import balances_bp
-    from backend.app.routes.expenses import expenses_bp
-    from backend.app.routes.groups import groups_bp
-    from backend.app.routes.settlements import settlements_bp
-    from backend.app.routes.users import users_bp
-
-    app.register_blueprint(auth_bp,        url_prefix="/api/v1/auth")
-    app.register_blueprint(groups_bp,      url_prefix="/api/v1/groups")
-    # expenses_bp is registered at /api/v1 (not /api/v1/expenses) because it
-    # owns BOTH /groups/<id>/expenses (create/list) AND /expenses/<id> (get/patch/delete).
-    # Registering at /api/v1/expenses would break the group-scoped paths.
-    app.register_blueprint(expenses_bp,    url_prefix="/api/v1")
-    app.register_blueprint(balances_bp,    url_prefix="/api/v1/groups")
-    app.register_blueprint(settlements_bp, url_prefix="/api/v1/groups")
-    app.register_blueprint(users_bp,       url_prefix="/api/v1/users")
+    selected = _BLUEPRINTS.keys() if names is None else names
+    for name in selected:
+        import_path, url_prefix = _BLUEPRINTS[name]
+        app.register_blueprint(import_string(import_path), url_prefix=url_prefix)
 
 
 def _register_error_handlers(app: Flask) -> None:
@@ -152,8 +265,6 @@ def _register_error_handlers(app: Flask) -> None:
       In production, only {"error": {"code": "INTERNAL_ERROR", "message": "..."}}
       is returned. The traceback is written to the app logger.
     """
-    from backend.app.errors import AppError, ErrorCode
-
     @app.errorhandler(AppError)
     def handle_app_error(error: AppError):
         """
@@ -174,10 +285,10 @@ def _register_error_handlers(app: Flask) -> None:
         (ARCHITECTURE.md Section 8 Design Principles).
 
         The error code from the ValidationError message is used directly if it
-        matches a known ErrorCode constant; otherwise INVALID_FIELD is used.
+        matches a known ErrorCode constant (including MISSING_FIELD, which every
+        required schema field uses as its "required" message); otherwise
+        INVALID_FIELD is used.
         """
-        from backend.app.errors import ErrorCode
-
         # Flatten the nested messages dict to find the first field+message pair.
         messages = error.messages  # e.g. {"amount": ["INVALID_AMOUNT_PRECISION"]}
 
@@ -195,24 +306,22 @@ def _register_error_handlers(app: Flask) -> None:
                     raw_message = str(field_errors)
 
                 # If the message is already one of our registered codes, keep it.
-                if raw_message in vars(ErrorCode).values():
+                # Required fields raise MISSING_FIELD this way (schemas set
+                # error_messages={"required": ErrorCode.MISSING_FIELD}).
+                if raw_message in ERROR_CODE_VALUES:
                     code = raw_message
-                elif str(raw_message).startswith("Missing data for required field"):
-                    code = ErrorCode.MISSING_FIELD
                 else:
                     code = ErrorCode.INVALID_FIELD
                 break
         elif isinstance(messages, list):
             raw_message = messages[0] if messages else "Invalid input."
-            if raw_message in vars(ErrorCode).values():
+            if raw_message in ERROR_CODE_VALUES:
                 code = raw_message
-            elif str(raw_message).startswith("Missing data for required field"):
-                code = ErrorCode.MISSING_FIELD
 
         response_body = {
             "error": {
                 "code": code,
-                "message": raw_message if raw_message not in vars(ErrorCode).values()
+                "message": raw_message if raw_message not in ERROR_CODE_VALUES
                 else _code_to_message(code),
             }
         }
@@ -230,11 +339,9 @@ def _register_error_handlers(app: Flask) -> None:
         production). Stack traces NEVER leave the server in the response body
         (ARCHITECTURE.md Section 8 Design Principles).
         """
-        app.logger.error(
-            "Unhandled exception: %s\n%s",
-            str(error),
-            traceback.format_exc(),
-        )
+        # exc_info defers traceback formatting to the handler that emits
+        # the record; nothing is formatted if the record is filtered out.
+        app.logger.error("Unhandled exception: %s", error, exc_info=error)
         return jsonify({
             "error": {
                 "code": ErrorCode.INTERNAL_ERROR,
@@ -243,29 +350,46 @@ def _register_error_handlers(app: Flask) -> None:
         }), 500
 
 
+# Static CORS headers for local development; only the Origin reflection
+# varies per request.
+_STATIC_CORS_HEADERS: dict[str, str] = {
+    "Vary": "Origin",
+    "Access-Control-Allow-Methods": "GET, POST, PATCH, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Authorization, Content-Type",
+}
+
+
 def _register_cors(app: Flask) -> None:
     """
     Adds CORS headers for browser-based local development.
 
-    By default this is enabled when DEBUG or TESTING is true so a frontend
-    served from another local port (for example :8000) can call the API on
-    :5000 with Authorization headers.
+    Enabled when DEBUG or TESTING is true so a frontend served from another
+    local port (for example :8000) can call the API on :5000 with
+    Authorization headers. The condition is evaluated once here; when it is
+    false (production) no after_request hook is registered at all.
     """
+    if not (app.config.get("DEBUG") or app.config.get("TESTING")):
+        return
 
     @app.after_request
     def add_cors_headers(response):
-        origin = request.headers.get("Origin")
-        allow_all = bool(app.config.get("DEBUG") or app.config.get("TESTING"))
+        # Reflect origin when present so bearer-auth requests from local
+        # dev servers are accepted by browsers.
+        response.headers["Access-Control-Allow-Origin"] = request.headers.get("Origin") or "*"
+        response.headers.update(_STATIC_CORS_HEADERS)
+        return response
 
-        if allow_all:
-            # Reflect origin when present so bearer-auth requests from local
-            # dev servers are accepted by browsers.
-            response.headers["Access-Control-Allow-Origin"] = origin if origin else "*"
-            response.headers["Vary"] = "Origin"
-            response.headers["Access-Control-Allow-Methods"] = "GET, POST, PATCH, DELETE, OPTIONS"
-            response.headers["Access-Control-Allow-Headers"] = "Authorization, Content-Type"
 
-        return response
+# Default human-readable messages for error codes that schemas raise as the
+# ValidationError message itself. Built once at import time.
+_CODE_MESSAGES: dict[str, str] = {
+    "MISSING_FIELD": "Missing data for required field.",
+    "INVALID_AMOUNT_PRECISION": "Amount must have at most 2 decimal places.",
+    "INVALID_CATEGORY": "The category value is not valid.",
+    "INVALID_SPLIT_MODE": "split_mode must be 'equal' or 'custom'.",
+    "SPLITS_SENT_FOR_EQUAL_MODE": "Do not send a splits array when split_mode is 'equal'.",
+    "DUPLICATE_SPLIT_USER": "The same user_id appears more than once in the splits array.",
+}
 
 
 def _code_to_message(code: str) -> str:
@@ -274,11 +398,4 @@ def _code_to_message(code: str) -> str:
     Used when a ValidationError message IS the error code constant itself
     (e.g. INVALID_AMOUNT_PRECISION raised as ValidationError in schemas).
     """
-    _messages = {
-        "INVALID_AMOUNT_PRECISION": "Amount must have at most 2 decimal places.",
-        "INVALID_CATEGORY": "The category value is not valid.",
-        "INVALID_SPLIT_MODE": "split_mode must be 'equal' or 'custom'.",
-        "SPLITS_SENT_FOR_EQUAL_MODE": "Do not send a splits array when split_mode is 'equal'.",
-        "DUPLICATE_SPLIT_USER": "The same user_id appears more than once in the splits array.",
-    }
-    return _messages.get(code, "Invalid input.")
+    return _CODE_MESSAGES.get(code, "Invalid input.")
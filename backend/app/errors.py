@@ -16,6 +16,10 @@ from __future__ import annotations
 
 class AppError(Exception):
 
+    # Fixed attribute layout: no per-instance __dict__ is materialised
+    # (BaseException creates one lazily, only if an unknown attribute is set).
+    __slots__ = ("code", "message", "http_status", "field")
+
     def __init__(
             self,
             code: str,
@@ -30,13 +34,16 @@ class AppError(Exception):
         self.field       = field  # which request field caused the error
 
     def to_dict(self) -> dict:
-        payload = {
-            "code":    self.code,
-            "message": self.message,
+        # One literal per shape — "field" is only present when set.
+        if self.field is None:
+            return {"error": {"code": self.code, "message": self.message}}
+        return {
+            "error": {
+                "code":    self.code,
+                "message": self.message,
+                "field":   self.field,
+            }
         }
-        if self.field is not None:
-            payload["field"] = self.field
-        return {"error": payload}
 
     def __repr__(self) -> str:
         return (
@@ -100,6 +107,16 @@ class ErrorCode:
     INTERNAL_ERROR             = "INTERNAL_ERROR"
 
 
+# Every registered error code string, built once at import time.
+# Used for O(1) "is this message already an error code?" checks
+# (e.g. the marshmallow ValidationError handler in app/__init__.py).
+ERROR_CODE_VALUES: frozenset[str] = frozenset(
+    value
+    for name, value in vars(ErrorCode).items()
+    if not name.startswith("_") and isinstance(value, str)
+)
+
+
 # ── Warning Code Registry ──────────────────────────────────────────────────
 #
 # Warnings are returned alongside a 2xx response in the `warnings` array.
@@ -9,7 +9,7 @@ Pattern:
     2. Call init_app(app) inside the app factory in app/__init__.py.
     3. Import `db` or `ma` from here wherever needed.
 
-    from app.extensions import db, ma
+    from backend.app.extensions import db, ma
 
 This is the standard Flask application-factory pattern. Do not pass the app
 object directly to SQLAlchemy() or Marshmallow() at import time — that would
@@ -19,10 +19,31 @@ prevent running tests with a separate test app instance.
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
 
-db = SQLAlchemy()
+# This module must be imported under exactly one name. Imported a second time
+# as `app.extensions`, it would build a second `db` — a second engine and
+# connection pool, and a MetaData no model is registered on.
+if __name__ != "backend.app.extensions":
+    raise ImportError(
+        f"Import extensions as 'backend.app.extensions', not '{__name__}'."
+    )
+
+# db.session is a scoped_session whose scope is the Flask app context; the
+# app factory resolves it once per request onto g.db_session (see
+# create_app). expire_on_commit=False keeps loaded attributes usable after
+# the route commits, so serializing the just-written object does not
+# re-SELECT every column and relationship it touches.
+#
+# Consequence: an object held across a commit keeps the values it had when
+# loaded. It does NOT see changes committed by other transactions, nor
+# changes this session made with bulk statements (insert()/delete()/update()
+# executed directly) — call session.expire(obj[, attrs]) or
+# session.refresh(obj) before reading such state. Attributes the database
+# fills in (server defaults, onupdate) are still expired at flush and load on
+# first access as usual.
+db = SQLAlchemy(session_options={"expire_on_commit": False})
 
 # Marshmallow instance — available for SQLAlchemy model serialization helpers.
-# Import as:  from app.extensions import ma
+# Import as:  from backend.app.extensions import ma
 #
 # IMPORTANT — schema inheritance rule:
 #   All validation Schema classes (in app/schemas/) must inherit from
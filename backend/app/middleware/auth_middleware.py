@@ -21,18 +21,131 @@ Error codes:
   TOKEN_INVALID  (401) — malformed header, invalid signature, or bad payload
   TOKEN_EXPIRED  (401) — valid token but exp claim is in the past
   → 403 FORBIDDEN is never raised here; it is raised by service functions.
+
+HS256 fast path:
+  Tokens are issued with HS256 (auth_service._create_access_token). When the
+  app is configured for HS256, _decode_hs256() verifies them with the stdlib
+  hmac module (OpenSSL) and orjson instead of PyJWT's generic pipeline. It
+  raises PyJWT's own exception classes, so error mapping is identical.
+  Successful verifications are memoized per (token, secret) in a bounded
+  LRU; exp is still checked on every request.
+  Any other configured algorithm goes through jwt.decode().
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
 import functools
+import hashlib
+import hmac
+import time
 from typing import Callable
 
 import jwt
+import orjson
 from flask import current_app, g, request
 
 from backend.app.errors import AppError, ErrorCode
 
+_BEARER_SCHEMES = ("Bearer", "bearer", "BEARER")
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    """Decodes one unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+def _decode_hs256(raw_token: str, secret: str) -> dict:
+    """
+    Verifies an HS256 JWT and returns its payload.
+
+    Mirrors jwt.decode(token, secret, algorithms=["HS256"]) with PyJWT 2.9's
+    default options (no leeway, no audience or issuer passed): header alg
+    must be HS256, the HMAC-SHA256 signature must match (constant-time
+    compare), exp / nbf / iat must be numeric, iat and nbf must not be in
+    the future, exp must be, and any non-empty aud claim is rejected. iss,
+    sub and jti are not checked, as jwt.decode() does not check them either.
+
+    Raises the same jwt exceptions as jwt.decode():
+      jwt.ExpiredSignatureError  — exp claim is in the past
+      jwt.ImmatureSignatureError — iat or nbf claim is in the future
+      jwt.InvalidAudienceError   — token carries an aud claim
+      jwt.InvalidTokenError      — (subclasses) anything else wrong
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = raw_token.encode("ascii").split(b".")
+    except (UnicodeEncodeError, ValueError):
+        raise jwt.DecodeError("Token must have exactly three segments.")
+
+    try:
+        header = orjson.loads(_b64url_decode(header_b64))
+        payload = orjson.loads(_b64url_decode(payload_b64))
+        signature = _b64url_decode(signature_b64)
+    except (binascii.Error, ValueError):
+        raise jwt.DecodeError("Token segments are not valid base64url JSON.")
+
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed.")
+
+    expected = hmac.new(
+        secret.encode("utf-8"),
+        header_b64 + b"." + payload_b64,
+        hashlib.sha256,
+    ).digest()
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed.")
+
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Token payload must be a JSON object.")
+
+    now = time.time()
+    for claim in ("exp", "nbf", "iat"):
+        value = payload.get(claim)
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, (int, float))
+        ):
+            raise jwt.DecodeError(f"The '{claim}' claim must be a number.")
+
+    # Same order as PyJWT's _validate_claims, so a token failing several
+    # checks raises the same exception.
+    if "iat" in payload and int(payload["iat"]) > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+    if "nbf" in payload and payload["nbf"] > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf).")
+    if "exp" in payload and payload["exp"] <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired.")
+    # No audience is configured, so any token naming one is not for us.
+    if payload.get("aud"):
+        raise jwt.InvalidAudienceError("Invalid audience")
+
+    return payload
+
+
+@functools.lru_cache(maxsize=4096)
+def _verified_hs256_payload(raw_token: str, secret: str) -> dict:
+    """
+    _decode_hs256 memoized on (token, secret). Only successful verifications
+    are cached — lru_cache does not store exceptions — so a hit means this
+    exact token string already passed the signature and claim checks under
+    this secret. Callers must not mutate the returned dict.
+    """
+    return _decode_hs256(raw_token, secret)
+
+
+def _decode_hs256_cached(raw_token: str, secret: str) -> dict:
+    """
+    Verifies an HS256 JWT, skipping the HMAC and JSON work for a token seen
+    recently. A browser session re-sends the same access token on every call
+    until it expires. exp is re-checked on every call, so a cached token
+    stops being accepted the moment it expires.
+    """
+    payload = _verified_hs256_payload(raw_token, secret)
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired.")
+    return payload
+
 
 def require_auth(f: Callable) -> Callable:
     """
@@ -48,88 +161,106 @@ def require_auth(f: Callable) -> Callable:
         def list_groups():
             user_id = g.user_id  # always an int when this runs
             ...
+
+    The authentication sequence runs inline in the wrapper (no extra call
+    frame per request). _authenticate_request below is the same wrapper
+    around an empty view, for calling the sequence directly in tests.
     """
     @functools.wraps(f)
     def decorated(*args, **kwargs):
-        _authenticate_request()
+        auth_header = request.headers.get("Authorization", "")
+
+        # ── Step 1: Require Authorization header ──────────────────────────
+        if not auth_header:
+            raise AppError(
+                ErrorCode.TOKEN_MISSING,
+                "Authentication required. Provide a Bearer token in the Authorization header.",
+                401,
+            )
+
+        # ── Step 2: Parse "Bearer <token>" format ─────────────────────────
+        # The scheme is case-insensitive; the tuple covers the common
+        # spellings without allocating, the lower() fallback the rest. Any
+        # whitespace may follow it, as with the str.split() this replaced.
+        if not (
+            (auth_header.startswith(_BEARER_SCHEMES) or auth_header[:6].lower() == "bearer")
+            and auth_header[6:7].isspace()
+        ):
+            raise AppError(
+                ErrorCode.TOKEN_INVALID,
+                "Authorization header must be in the format: Bearer <token>.",
+                401,
+            )
+
+        raw_token = auth_header[7:].strip()
+        if not raw_token or " " in raw_token:
+            raise AppError(
+                ErrorCode.TOKEN_INVALID,
+                "Authorization header must be in the format: Bearer <token>.",
+                401,
+            )
+
+        # ── Step 3: Decode and verify the JWT ─────────────────────────────
+        # (secret, [algorithm]) is cached on the app by create_app().
+        secret, algorithms = current_app.extensions["_jwt_params"]
+        try:
+            if algorithms == ["HS256"]:
+                payload = _decode_hs256_cached(raw_token, secret)
+            else:
+                payload = jwt.decode(raw_token, secret, algorithms=algorithms)
+        except jwt.ExpiredSignatureError:
+            # Token was valid but the exp claim has passed.
+            # Client should use POST /auth/refresh.
+            raise AppError(
+                ErrorCode.TOKEN_EXPIRED,
+                "The access token has expired. Use POST /auth/refresh to obtain a new one.",
+                401,
+            )
+        except jwt.InvalidTokenError:
+            # Covers: bad signature, malformed token, invalid claims, etc.
+            raise AppError(
+                ErrorCode.TOKEN_INVALID,
+                "The access token is invalid or has been tampered with.",
+                401,
+            )
+
+        # ── Step 4: Extract and validate the sub (user_id) claim ──────────
+        sub = payload.get("sub")
+        if sub is None:
+            raise AppError(
+                ErrorCode.TOKEN_INVALID,
+                "The access token is missing the required 'sub' claim.",
+                401,
+            )
+
+        try:
+            user_id = int(sub)
+        except (TypeError, ValueError):
+            raise AppError(
+                ErrorCode.TOKEN_INVALID,
+                "The 'sub' claim in the access token is not a valid user ID.",
+                401,
+            )
+
+        # ── Step 5: Attach user_id to flask.g ─────────────────────────────
+        # Services read g.user_id via the route which passes it as a plain int.
+        # Services never import flask.g directly — they receive user_id as an arg.
+        g.user_id = user_id
+
         return f(*args, **kwargs)
 
     return decorated
 
 
+@require_auth
 def _authenticate_request() -> None:
     """
     Performs the full JWT authentication sequence and sets flask.g.user_id.
 
-    Separated from the decorator wrapper for testability — can be called
-    directly in tests without wrapping a real view function.
+    An empty view wrapped by require_auth, so it runs exactly the code every
+    protected route runs. Can be called directly in tests (inside a request
+    context) without wrapping a real view function.
 
     Raises AppError on any authentication failure (never returns a response
     directly — error propagates to the global Flask error handler).
     """
-    auth_header = request.headers.get("Authorization", "")
-
-    # ── Step 1: Require Authorization header ──────────────────────────────
-    if not auth_header:
-        raise AppError(
-            ErrorCode.TOKEN_MISSING,
-            "Authentication required. Provide a Bearer token in the Authorization header.",
-            401,
-        )
-
-    # ── Step 2: Parse "Bearer <token>" format ─────────────────────────────
-    parts = auth_header.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise AppError(
-            ErrorCode.TOKEN_INVALID,
-            "Authorization header must be in the format: Bearer <token>.",
-            401,
-        )
-
-    raw_token = parts[1]
-
-    # ── Step 3: Decode and verify the JWT ─────────────────────────────────
-    try:
-        payload = jwt.decode(
-            raw_token,
-            current_app.config["JWT_SECRET_KEY"],
-            algorithms=[current_app.config.get("JWT_ALGORITHM", "HS256")],
-        )
-    except jwt.ExpiredSignatureError:
-        # Token was valid but the exp claim has passed.
-        # Client should use POST /auth/refresh.
-        raise AppError(
-            ErrorCode.TOKEN_EXPIRED,
-            "The access token has expired. Use POST /auth/refresh to obtain a new one.",
-            401,
-        )
-    except jwt.InvalidTokenError:
-        # Covers: bad signature, malformed token, invalid claims, etc.
-        raise AppError(
-            ErrorCode.TOKEN_INVALID,
-            "The access token is invalid or has been tampered with.",
-            401,
-        )
-
-    # ── Step 4: Extract and validate the sub (user_id) claim ──────────────
-    sub = payload.get("sub")
-    if sub is None:
-        raise AppError(
-            ErrorCode.TOKEN_INVALID,
-            "The access token is missing the required 'sub' claim.",
-            401,
-        )
-
-    try:
-        user_id = int(sub)
-    except (TypeError, ValueError):
-        raise AppError(
-            ErrorCode.TOKEN_INVALID,
-            "The 'sub' claim in the access token is not a valid user ID.",
-            401,
-        )
-
-    # ── Step 5: Attach user_id to flask.g ─────────────────────────────────
-    # Services read g.user_id via the route which passes it as a plain int.
-    # Services never import flask.g directly — they receive user_id as an arg.
-    g.user_id = user_id
@@ -0,0 +1,47 @@
+"""
+middleware/transaction.py — Per-request transaction decorator.
+
+The @transactional decorator gives a write route exactly one transaction:
+  1. The view runs (parse → one service call → serialize), all inside the
+     request's session (g.db_session, bound in create_app()).
+  2. If the view returns normally, the session is committed once.
+  3. If the view raises — AppError, ValidationError or anything else — the
+     session is rolled back and the exception propagates unchanged to the
+     app's error handlers.
+
+Routes therefore never call commit() themselves; services still only
+flush (GUIDE Rule 3). The response is serialized before the commit, while
+the objects are fresh. A failed commit (e.g. the deferred INV-1 split-sum
+trigger) raises from here and is reported like any other error.
+
+Usage — stack it under @require_auth so authentication fails before any
+transaction work:
+
+    @bp.route("/things", methods=["POST"])
+    @require_auth
+    @transactional
+    def create_thing(): ...
+"""
+
+from __future__ import annotations
+
+import functools
+
+from flask import g
+
+
+def transactional(f):
+    """Commits g.db_session after f returns; rolls it back if f raises."""
+
+    @functools.wraps(f)
+    def decorated(*args, **kwargs):
+        session = g.db_session
+        try:
+            response = f(*args, **kwargs)
+        except Exception:
+            session.rollback()
+            raise
+        session.commit()
+        return response
+
+    return decorated
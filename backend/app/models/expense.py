@@ -17,6 +17,7 @@ Key design points:
 from __future__ import annotations
 
 import enum
+import functools
 from datetime import datetime
 from decimal import Decimal
 
@@ -29,7 +30,9 @@ from sqlalchemy import (
     Numeric,
     String,
     func,
+    text,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.extensions import db
@@ -56,9 +59,21 @@ class Category(str, enum.Enum):
     OTHER           = "other"
 
 
+@functools.lru_cache(maxsize=None)
+def _enum_value_tuple(enum_cls: type[enum.Enum]) -> tuple[str, ...]:
+    """Member values of enum_cls, computed once per enum class."""
+    return tuple(member.value for member in enum_cls)
+
+
 def _enum_values(enum_cls: type[enum.Enum]) -> list[str]:
-    """Ensure SQLAlchemy stores enum values (e.g., 'custom'), not names ('CUSTOM')."""
-    return [member.value for member in enum_cls]
+    """
+    Ensure SQLAlchemy stores enum values (e.g., 'custom'), not names ('CUSTOM').
+
+    SQLAlchemy calls this every time it (re)builds the Enum type — column
+    construction, type adaptation and copies — so the values are cached in
+    _enum_value_tuple; SQLAlchemy expects a list, hence the copy.
+    """
+    return list(_enum_value_tuple(enum_cls))
 
 
 # ── Model ──────────────────────────────────────────────────────────────────
@@ -77,13 +92,15 @@ class Expense(db.Model):
             name="ck_expenses_description_nonempty",
         ),
 
-        # Spec: partial index for active-only expense queries (idx_expenses_active).
-        # The balance service always queries through get_active_expenses(), which
-        # filters deleted_at IS NULL; this index makes those queries efficient.
+        # Spec: partial index for active-only expense queries (idx_expenses_active,
+        # widened by migration 005). The balance service always queries through
+        # the ledger CTE, which filters deleted_at IS NULL; list_expenses
+        # additionally orders by created_at DESC, which the second key serves.
         Index(
-            "idx_expenses_active",
+            "idx_expenses_active_created",
             "group_id",
-            postgresql_where="deleted_at IS NULL",
+            text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
         ),
     )
 
@@ -183,15 +200,27 @@ class Expense(db.Model):
 
     # ── Convenience property ───────────────────────────────────────────────
     # Read-only; does NOT contain logic — just inspects a column value.
-    @property
+    # Hybrid: on an instance it is a Python bool; on the class it compiles
+    # to "expenses.deleted_at IS NOT NULL", so it can be used in WHERE clauses
+    # (e.g. select(Expense).where(Expense.is_deleted)).
+    @hybrid_property
     def is_deleted(self) -> bool:
         """True if this expense has been soft-deleted."""
         return self.deleted_at is not None
 
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deleted_at.is_not(None)
+
     def __repr__(self) -> str:  # pragma: no cover
+        # Reads only already-loaded state (instance __dict__), so repr() of an
+        # expired or detached instance — in a log line, a debugger frame or a
+        # traceback — never issues a lazy SELECT. Unloaded values show as None.
+        d = self.__dict__
         return (
-            f"<Expense id={self.id} "
-            f"group_id={self.group_id} "
-            f"amount={self.amount} "
-            f"deleted={self.is_deleted}>"
+            f"<Expense id={d.get('id')} "
+            f"group_id={d.get('group_id')} "
+            f"amount={d.get('amount')} "
+            f"deleted={d.get('deleted_at') is not None}>"
         )
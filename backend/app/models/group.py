@@ -75,4 +75,5 @@ class Group(db.Model):
     )
 
     def __repr__(self) -> str:  # pragma: no cover
-        return f"<Group id={self.id} name={self.name!r}>"
\ No newline at end of file
+        d = self.__dict__
+        return f"<Group id={d.get('id')} name={d.get('name')!r}>"
\ No newline at end of file
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.extensions import db
@@ -24,6 +24,11 @@ class Membership(db.Model):
     __table_args__ = (
         # Spec: UNIQUE(user_id, group_id) — a user can only belong to a group once.
         UniqueConstraint("user_id", "group_id", name="uq_memberships_user_group"),
+
+        # Lookup by group (idx_memberships_group, widened by migration 006).
+        # Every membership check reads only user_id for a group_id, so keying
+        # on (group_id, user_id) lets PostgreSQL answer from the index alone.
+        Index("idx_memberships_group_user", "group_id", "user_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -39,7 +44,6 @@ class Membership(db.Model):
     group_id: Mapped[int] = mapped_column(
         ForeignKey("groups.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,   # idx_memberships_group (spec Section 6)
     )
 
     joined_at: Mapped[datetime] = mapped_column(
@@ -61,8 +65,9 @@ class Membership(db.Model):
     )
 
     def __repr__(self) -> str:  # pragma: no cover
+        d = self.__dict__
         return (
-            f"<Membership id={self.id} "
-            f"user_id={self.user_id} "
-            f"group_id={self.group_id}>"
+            f"<Membership id={d.get('id')} "
+            f"user_id={d.get('user_id')} "
+            f"group_id={d.get('group_id')}>"
         )
\ No newline at end of file
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, LargeBinary, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.extensions import db
@@ -20,6 +20,17 @@ from backend.app.extensions import db
 
 class RefreshToken(db.Model):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Unique on token_hash; user_id/expires_at/revoked ride along in the
+        # index leaf so the /auth/refresh lookup is an index-only scan
+        # (migration 004 — replaces the original uq_refresh_tokens_hash).
+        Index(
+            "idx_refresh_tokens_hash_covering",
+            "token_hash",
+            unique=True,
+            postgresql_include=["user_id", "expires_at", "revoked"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -30,15 +41,15 @@ class RefreshToken(db.Model):
         index=True,   # idx_refresh_tokens_user (spec Section 6)
     )
 
-    # Spec: VARCHAR(255) NOT NULL UNIQUE
-    # Stores the SHA-256 hex digest of the raw refresh token, never the token itself.
-    # auth_service._hash_token() computes hashlib.sha256(raw_token).hexdigest()
+    # BYTEA NOT NULL UNIQUE (migration 003; originally VARCHAR(255) hex).
+    # Uniqueness comes from idx_refresh_tokens_hash_covering above.
+    # Stores the 32-byte SHA-256 digest of the raw refresh token, never the token itself.
+    # auth_service._hash_token() computes hashlib.sha256(raw_token).digest()
     # before any DB read/write. A compromised DB does not expose valid raw tokens.
     # ARCHITECTURE.md Section 7: "stored as a SHA-256 hash in the database, never the raw value."
-    token_hash: Mapped[str] = mapped_column(
-        String(255),
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         nullable=False,
-        unique=True,
     )
 
     expires_at: Mapped[datetime] = mapped_column(
@@ -69,8 +80,9 @@ class RefreshToken(db.Model):
     )
 
     def __repr__(self) -> str:  # pragma: no cover
+        d = self.__dict__
         return (
-            f"<RefreshToken id={self.id} "
-            f"user_id={self.user_id} "
-            f"revoked={self.revoked}>"
+            f"<RefreshToken id={d.get('id')} "
+            f"user_id={d.get('user_id')} "
+            f"revoked={d.get('revoked')}>"
         )
\ No newline at end of file
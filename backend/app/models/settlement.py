@@ -95,10 +95,11 @@ class Settlement(db.Model):
     )
 
     def __repr__(self) -> str:  # pragma: no cover
+        d = self.__dict__
         return (
-            f"<Settlement id={self.id} "
-            f"group_id={self.group_id} "
-            f"from={self.paid_by_user_id} "
-            f"to={self.paid_to_user_id} "
-            f"amount={self.amount}>"
+            f"<Settlement id={d.get('id')} "
+            f"group_id={d.get('group_id')} "
+            f"from={d.get('paid_by_user_id')} "
+            f"to={d.get('paid_to_user_id')} "
+            f"amount={d.get('amount')}>"
         )
\ No newline at end of file
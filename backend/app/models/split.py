@@ -74,9 +74,10 @@ class Split(db.Model):
     )
 
     def __repr__(self) -> str:  # pragma: no cover
+        d = self.__dict__
         return (
-            f"<Split id={self.id} "
-            f"expense_id={self.expense_id} "
-            f"user_id={self.user_id} "
-            f"amount={self.amount}>"
+            f"<Split id={d.get('id')} "
+            f"expense_id={d.get('expense_id')} "
+            f"user_id={d.get('user_id')} "
+            f"amount={d.get('amount')}>"
         )
\ No newline at end of file
@@ -103,4 +103,5 @@ class User(db.Model):
     )
 
     def __repr__(self) -> str:  # pragma: no cover
-        return f"<User id={self.id} username={self.username!r}>"
\ No newline at end of file
+        d = self.__dict__
+        return f"<User id={d.get('id')} username={d.get('username')!r}>"
\ No newline at end of file
@@ -5,7 +5,7 @@ Layer rules (GUIDE Rule 3 + ARCHITECTURE.md Section 2):
   - Parse request body
   - Validate with the appropriate schema (raises ValidationError on bad input)
   - Call exactly ONE service function
-  - Commit the DB session
+  - Commit the DB session (via @transactional — middleware/transaction.py)
   - Return the standard response envelope: {"data": {...}, "warnings": []}
 
 No business logic here. No DB queries. No bare SQL.
@@ -24,63 +24,69 @@ from __future__ import annotations
 
 from flask import Blueprint, g, jsonify, request
 
-from backend.app.extensions import db
 from backend.app.middleware.auth_middleware import require_auth
+from backend.app.middleware.transaction import transactional
 from backend.app.schemas.auth_schema import LoginSchema, RefreshTokenSchema, RegisterSchema
 from backend.app.services import auth_service
 
 auth_bp = Blueprint("auth", __name__)
 
+# Schema instances are stateless for load() and built once per process
+# rather than once per request.
+_register_schema = RegisterSchema()
+_login_schema = LoginSchema()
+_refresh_token_schema = RefreshTokenSchema()
+
 
 @auth_bp.route("/register", methods=["POST"])
+@transactional
 def register():
     """POST /auth/register — Create account; return tokens. (No auth required.)"""
-    data = RegisterSchema().load(request.get_json(force=True) or {})
+    data = _register_schema.load(request.get_json(force=True, silent=True) or {})
     result = auth_service.register_user(
         username=data["username"],
         email=data["email"],
         password=data["password"],
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": result, "warnings": []}), 201
 
 
 @auth_bp.route("/login", methods=["POST"])
+@transactional
 def login():
     """POST /auth/login — Authenticate; return tokens. (No auth required.)"""
-    data = LoginSchema().load(request.get_json(force=True) or {})
+    data = _login_schema.load(request.get_json(force=True, silent=True) or {})
     result = auth_service.login_user(
         username=data["username"],
         password=data["password"],
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": result, "warnings": []}), 200
 
 
 @auth_bp.route("/refresh", methods=["POST"])
+@transactional
 def refresh():
     """POST /auth/refresh — Exchange refresh token for new access token."""
-    data = RefreshTokenSchema().load(request.get_json(force=True) or {})
+    data = _refresh_token_schema.load(request.get_json(force=True, silent=True) or {})
     result = auth_service.refresh_access_token(
         raw_refresh_token=data["refresh_token"],
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": result, "warnings": []}), 200
 
 
 @auth_bp.route("/logout", methods=["POST"])
 @require_auth
+@transactional
 def logout():
     """POST /auth/logout — Revoke refresh token. (Auth required.)"""
-    data = RefreshTokenSchema().load(request.get_json(force=True) or {})
+    data = _refresh_token_schema.load(request.get_json(force=True, silent=True) or {})
     auth_service.logout_user(
         raw_refresh_token=data["refresh_token"],
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": {"message": "Logged out successfully."}, "warnings": []}), 200
 
 
@@ -90,6 +96,6 @@ def me():
     """GET /auth/me — Return current user profile. (Auth required.)"""
     result = auth_service.get_current_user(
         user_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
     )
     return jsonify({"data": result, "warnings": []}), 200
\ No newline at end of file
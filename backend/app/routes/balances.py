@@ -18,13 +18,17 @@ from __future__ import annotations
 from flask import Blueprint, g, jsonify, request
 
 from backend.app.errors import AppError, ErrorCode
-from backend.app.extensions import db
 from backend.app.middleware.auth_middleware import require_auth
 from backend.app.models.expense import Category
 from backend.app.services import balance_service
 
 balances_bp = Blueprint("balances", __name__)
 
+# ?category= lookup table and the list quoted in INVALID_CATEGORY messages,
+# both built once from the Category enum.
+_CATEGORY_BY_VALUE: dict[str, Category] = {c.value: c for c in Category}
+_VALID_CATEGORY_VALUES = ", ".join(_CATEGORY_BY_VALUE)
+
 
 @balances_bp.route("/<int:group_id>/balances", methods=["GET"])
 @require_auth
@@ -49,13 +53,12 @@ def get_balances(group_id: int):
     category = None
 
     if category_param is not None:
-        try:
-            category = Category(category_param)
-        except ValueError:
+        category = _CATEGORY_BY_VALUE.get(category_param)
+        if category is None:
             raise AppError(
                 ErrorCode.INVALID_CATEGORY,
                 f"'{category_param}' is not a valid category. "
-                f"Valid values: {', '.join(c.value for c in Category)}.",
+                f"Valid values: {_VALID_CATEGORY_VALUES}.",
                 400,
                 field="category",
             )
@@ -63,7 +66,7 @@ def get_balances(group_id: int):
     result = balance_service.get_balance_response(
         group_id=group_id,
         caller_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
         category=category,
     )
     return jsonify({"data": result, "warnings": []}), 200
\ No newline at end of file
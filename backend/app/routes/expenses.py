@@ -7,7 +7,7 @@ expense-ID paths (/expenses/:id). Registering at /api/v1/expenses would
 make the group-scoped paths unreachable.
 
 Layer rules (GUIDE Rule 3):
-  - Parse, validate, call ONE service, commit, return envelope.
+  - Parse, validate, call ONE service, return envelope; @transactional commits.
   - No business logic. No DB queries. No bare SQL.
   - _serialize_expense() is a pure data-shape helper — not business logic.
 
@@ -17,25 +17,96 @@ Endpoints (spec Section 8.3):
   GET    /expenses/:id          → 200  get expense + splits
   PATCH  /expenses/:id          → 200  partial update
   DELETE /expenses/:id          → 200  soft-delete
+  PUT    /groups/:id/expenses/:id → 200 legacy full overwrite (frontend)
 """
 
 from __future__ import annotations
 
-from flask import Blueprint, g, jsonify, request
+from decimal import Decimal, InvalidOperation
+from typing import Iterator
 
-from backend.app.extensions import db
+import orjson
+from flask import Blueprint, Response, g, jsonify, request, stream_with_context
+
+from backend.app.errors import AppError, ErrorCode
 from backend.app.middleware.auth_middleware import require_auth
-from backend.app.models.expense import Expense
+from backend.app.middleware.transaction import transactional
+from backend.app.models.expense import Category, Expense, SplitMode
 from backend.app.schemas.expense_schema import CreateExpenseSchema, PatchExpenseSchema
 from backend.app.services import expense_service
-from backend.app.models.expense import Expense
-from backend.app.models.split import Split
 
 expenses_bp = Blueprint("expenses", __name__)
 
+_create_expense_schema = CreateExpenseSchema()
+_patch_expense_schema = PatchExpenseSchema()
+
+def _parse_put_amount(value, field: str) -> Decimal:
+    """Decimal(str(value)) for the schema-less legacy PUT; 400 on junk."""
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        amount = None
+    if amount is None or not amount.is_finite():
+        raise AppError(
+            ErrorCode.INVALID_FIELD,
+            f"'{value}' is not a valid amount.",
+            400,
+            field=field,
+        )
+    return amount
+
+
+def _parse_put_body(body: dict) -> dict:
+    """
+    Coerces the schema-less legacy PUT body into the types the model and
+    _serialize_expense() expect. Only keys present in the body are returned.
+    """
+    data = {}
+    for key in ("description", "paid_by_user_id"):
+        if key in body:
+            data[key] = body[key]
+    if "amount" in body:
+        data["amount"] = _parse_put_amount(body["amount"], "amount")
+    if "category" in body:
+        try:
+            data["category"] = Category(body["category"])
+        except ValueError:
+            raise AppError(
+                ErrorCode.INVALID_CATEGORY,
+                f"'{body['category']}' is not a valid category.",
+                400,
+                field="category",
+            )
+    if "split_mode" in body:
+        try:
+            data["split_mode"] = SplitMode(body["split_mode"])
+        except ValueError:
+            raise AppError(
+                ErrorCode.INVALID_SPLIT_MODE,
+                f"'{body['split_mode']}' is not a valid split mode.",
+                400,
+                field="split_mode",
+            )
+    if "splits" in body:
+        data["splits"] = [
+            {
+                "user_id": s["user_id"],
+                "amount": _parse_put_amount(s["amount"], "splits"),
+            }
+            for s in body["splits"] or []
+        ]
+    return data
+
 
 # ── Serialization helper ───────────────────────────────────────────────────
 # Pure data-shaping — no DB access, no logic. Amounts as strings per spec.
+#
+# Amounts stay Decimal end to end (GUIDE Rule 2) and are formatted with a
+# plain str(): NUMERIC(12, 2) columns load with a fixed exponent of -2, so
+# str() already yields exactly two decimal places ("10.50") without a
+# quantize(), and CPython's Decimal is the C _decimal module, not pure
+# Python. Integer-cent columns would trade that for a conversion at every
+# model boundary.
 
 def _serialize_expense(expense: Expense) -> dict:
     """Converts an Expense ORM object to a plain dict for JSON output."""
@@ -63,39 +134,57 @@ def _serialize_expense(expense: Expense) -> dict:
     }
 
 
+def _stream_expense_list(expenses) -> Iterator[bytes]:
+    """
+    Yields the {"data": [...], "warnings": []} envelope one expense at a time.
+    _serialize_expense() output is plain JSON types, so orjson needs no
+    default= hook here.
+    """
+    yield b'{"data":['
+    separator = b""
+    for expense in expenses:
+        yield separator + orjson.dumps(_serialize_expense(expense))
+        separator = b","
+    yield b'],"warnings":[]}'
+
+
 # ── Group-scoped expense routes ────────────────────────────────────────────
 
 @expenses_bp.route("/groups/<int:group_id>/expenses", methods=["POST"])
 @require_auth
+@transactional
 def create_expense(group_id: int):
     """
     POST /groups/:id/expenses — Record a new expense.
     Handles both 'equal' (server computes splits) and 'custom' modes.
     """
-    data = CreateExpenseSchema().load(request.get_json(force=True) or {})
+    data = _create_expense_schema.load(request.get_json(force=True, silent=True) or {})
     expense = expense_service.create_expense(
         group_id=group_id,
         caller_id=g.user_id,
         data=data,
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": _serialize_expense(expense), "warnings": []}), 201
 
 
 @expenses_bp.route("/groups/<int:group_id>/expenses", methods=["GET"])
 @require_auth
 def list_expenses(group_id: int):
-    """GET /groups/:id/expenses — List active (non-deleted) expenses for a group."""
+    """
+    GET /groups/:id/expenses — List active (non-deleted) expenses for a group.
+    The body is streamed: expenses are serialized as the service yields them.
+    """
     expenses = expense_service.list_expenses(
         group_id=group_id,
         caller_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
+    )
+    return Response(
+        stream_with_context(_stream_expense_list(expenses)),
+        status=200,
+        mimetype="application/json",
     )
-    return jsonify({
-        "data": [_serialize_expense(e) for e in expenses],
-        "warnings": [],
-    }), 200
 
 
 # ── Expense-ID routes ──────────────────────────────────────────────────────
@@ -107,32 +196,33 @@ def get_expense(expense_id: int):
     expense = expense_service.get_expense(
         expense_id=expense_id,
         caller_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
     )
     return jsonify({"data": _serialize_expense(expense), "warnings": []}), 200
 
 
 @expenses_bp.route("/expenses/<int:expense_id>", methods=["PATCH"])
 @require_auth
+@transactional
 def edit_expense(expense_id: int):
     """
     PATCH /expenses/:id — Partial update.
     If amount or splits change, both must be present; INV-1 is re-validated.
     Only original payer or group owner may edit.
     """
-    data = PatchExpenseSchema().load(request.get_json(force=True) or {})
+    data = _patch_expense_schema.load(request.get_json(force=True, silent=True) or {})
     expense = expense_service.edit_expense(
         expense_id=expense_id,
         caller_id=g.user_id,
         data=data,
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": _serialize_expense(expense), "warnings": []}), 200
 
 
 @expenses_bp.route("/expenses/<int:expense_id>", methods=["DELETE"])
 @require_auth
+@transactional
 def delete_expense(expense_id: int):
     """
     DELETE /expenses/:id — Soft-delete (sets deleted_at = NOW()).
@@ -141,9 +231,8 @@ def delete_expense(expense_id: int):
     expense_service.delete_expense(
         expense_id=expense_id,
         caller_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({
         "data": {
             "deleted": True,
@@ -154,37 +243,18 @@ def delete_expense(expense_id: int):
 
 @expenses_bp.route("/groups/<int:group_id>/expenses/<int:expense_id>", methods=["PUT"])
 @require_auth
-def update_expense(group_id, expense_id):
-    # Use g.user_id to match your project's auth pattern
-    user_id = g.user_id
-    expense = Expense.query.filter_by(id=expense_id, group_id=group_id).first_or_404()
-
-    if expense.paid_by_user_id != user_id:
-        return jsonify({"error": "Only the payer can edit this expense"}), 403
-
-    data = request.get_json()
-
-    # Update main fields
-    expense.description = data.get("description", expense.description)
-    expense.amount = data.get("amount", expense.amount)
-    expense.category = data.get("category", expense.category)
-    expense.paid_by_user_id = data.get("paid_by_user_id", expense.paid_by_user_id)
-    expense.split_mode = data.get("split_mode", expense.split_mode)
-    expense.updated_at = db.func.now()
-
-    # UPDATE SPLITS
-    if "splits" in data:
-        # 1. Clear existing splits
-        Split.query.filter_by(expense_id=expense.id).delete()
-
-        # 2. Add new splits from the frontend payload
-        for s in data["splits"]:
-            new_split = Split(
-                expense_id=expense.id,
-                user_id=s["user_id"],
-                amount=s["amount"]
-            )
-            db.session.add(new_split)
-
-    db.session.commit() # This saves everything at once
-    return jsonify({"data": _serialize_expense(expense)}), 200
\ No newline at end of file
+@transactional
+def update_expense(group_id: int, expense_id: int):
+    """
+    PUT /groups/:id/expenses/:id — Legacy full overwrite, used by the frontend.
+    Only the original payer may call it; INV-1 is re-checked on the stored rows.
+    """
+    data = _parse_put_body(request.get_json(force=True, silent=True) or {})
+    expense = expense_service.replace_expense(
+        group_id=group_id,
+        expense_id=expense_id,
+        caller_id=g.user_id,
+        data=data,
+        session=g.db_session,
+    )
+    return jsonify({"data": _serialize_expense(expense), "warnings": []}), 200
@@ -2,7 +2,7 @@
 routes/groups.py — Group and membership route handlers.
 
 Layer rules (GUIDE Rule 3):
-  - Parse, validate, call ONE service, commit, return envelope.
+  - Parse, validate, call ONE service, return envelope; @transactional commits.
   - No business logic. No DB queries. No bare SQL.
 
 Endpoints (spec Section 8.2, base url_prefix=/api/v1/groups):
@@ -17,25 +17,28 @@ from __future__ import annotations
 
 from flask import Blueprint, g, jsonify, request
 
-from backend.app.extensions import db
 from backend.app.middleware.auth_middleware import require_auth
+from backend.app.middleware.transaction import transactional
 from backend.app.schemas.group_schema import AddMemberSchema, CreateGroupSchema
 from backend.app.services import group_service
 
 groups_bp = Blueprint("groups", __name__)
 
+_create_group_schema = CreateGroupSchema()
+_add_member_schema = AddMemberSchema()
+
 
 @groups_bp.route("/", methods=["POST"])
 @require_auth
+@transactional
 def create_group():
     """POST /groups — Create a new group. Caller becomes owner and first member."""
-    data = CreateGroupSchema().load(request.get_json(force=True) or {})
+    data = _create_group_schema.load(request.get_json(force=True, silent=True) or {})
     result = group_service.create_group(
         name=data["name"],
         owner_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": result, "warnings": []}), 201
 
 
@@ -45,7 +48,7 @@ def list_groups():
     """GET /groups — List all groups the authenticated user belongs to."""
     result = group_service.list_groups(
         user_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
     )
     return jsonify({"data": result, "warnings": []}), 200
 
@@ -57,37 +60,37 @@ def get_group(group_id: int):
     result = group_service.get_group(
         group_id=group_id,
         caller_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
     )
     return jsonify({"data": result, "warnings": []}), 200
 
 
 @groups_bp.route("/<int:group_id>/members", methods=["POST"])
 @require_auth
+@transactional
 def add_member(group_id: int):
     """POST /groups/:id/members — Add a user to the group. Owner only."""
-    data = AddMemberSchema().load(request.get_json(force=True) or {})
+    data = _add_member_schema.load(request.get_json(force=True, silent=True) or {})
     result = group_service.add_member(
         group_id=group_id,
         caller_id=g.user_id,
         target_user_id=data["user_id"],
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": result, "warnings": []}), 201
 
 
 @groups_bp.route("/<int:group_id>/members/<int:target_uid>", methods=["DELETE"])
 @require_auth
+@transactional
 def remove_member(group_id: int, target_uid: int):
     """DELETE /groups/:id/members/:uid — Remove a member. Owner removes anyone; member removes self."""
     group_service.remove_member(
         group_id=group_id,
         caller_id=g.user_id,
         target_user_id=target_uid,
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({
         "data": {
             "removed": True,
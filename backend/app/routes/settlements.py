@@ -2,7 +2,7 @@
 routes/settlements.py — Settlement route handlers.
 
 Layer rules (GUIDE Rule 3):
-  - Parse, validate, call ONE service, commit, return envelope.
+  - Parse, validate, call ONE service, return envelope; @transactional commits.
   - No business logic. No DB queries. No bare SQL.
 
 Special: create_settlement returns (Settlement, warnings[]).
@@ -19,14 +19,16 @@ from __future__ import annotations
 
 from flask import Blueprint, g, jsonify, request
 
-from backend.app.extensions import db
 from backend.app.middleware.auth_middleware import require_auth
+from backend.app.middleware.transaction import transactional
 from backend.app.models.settlement import Settlement
 from backend.app.schemas.settlement_schema import CreateSettlementSchema
 from backend.app.services import settlement_service
 
 settlements_bp = Blueprint("settlements", __name__)
 
+_create_settlement_schema = CreateSettlementSchema()
+
 
 # ── Serialization helper ───────────────────────────────────────────────────
 
@@ -40,7 +42,9 @@ def _serialize_settlement(s: Settlement) -> dict:
         "paid_to_user_id": s.paid_to_user_id,
         "paid_to_username": s.recipient.username,    # <-- Uses 'recipient'
         "amount": str(s.amount),  # Decimal → string (spec: never JS number)
-        "created_at": s.created_at.isoformat(),
+        # datetime goes to the JSON provider as-is: orjson writes the same
+        # ISO-8601 text as isoformat(), without a Python call per row.
+        "created_at": s.created_at,
     }
 
 
@@ -48,6 +52,7 @@ def _serialize_settlement(s: Settlement) -> dict:
 
 @settlements_bp.route("/<int:group_id>/settlements", methods=["POST"])
 @require_auth
+@transactional
 def create_settlement(group_id: int):
     """
     POST /groups/:id/settlements — Record a debt payment.
@@ -58,14 +63,13 @@ def create_settlement(group_id: int):
     If the amount exceeds current debt (INV-3), the settlement is still
     recorded and a warning is included in the response. Status remains 201.
     """
-    data = CreateSettlementSchema().load(request.get_json(force=True) or {})
+    data = _create_settlement_schema.load(request.get_json(force=True, silent=True) or {})
     settlement, warnings = settlement_service.create_settlement(
         group_id=group_id,
         paid_by_id=g.user_id,
         data=data,
-        session=db.session,
+        session=g.db_session,
     )
-    db.session.commit()
     return jsonify({"data": _serialize_settlement(settlement), "warnings": warnings}), 201
 
 
@@ -76,7 +80,7 @@ def list_settlements(group_id: int):
     settlements = settlement_service.list_settlements(
         group_id=group_id,
         caller_id=g.user_id,
-        session=db.session,
+        session=g.db_session,
     )
     return jsonify({
         "data": [_serialize_settlement(s) for s in settlements],
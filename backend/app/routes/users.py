@@ -1,29 +1,33 @@
 # backend/app/routes/users.py
-from flask import Blueprint, jsonify
+from flask import Blueprint, g, jsonify
 from sqlalchemy import select
-from backend.app.extensions import db
 from backend.app.models.user import User
 from backend.app.middleware.auth_middleware import require_auth
 from backend.app.errors import AppError, ErrorCode
 
 users_bp = Blueprint("users", __name__)
 
+_LOOKUP_MAX_AGE_SECONDS = 30
+
 @users_bp.route("/by-username/<string:username>", methods=["GET"])
 @require_auth
 def get_user_by_username(username: str):
-    # Query the user using SQLAlchemy 2.0 syntax
-    user = db.session.execute(
-        select(User).where(User.username == username)
-    ).scalar_one_or_none()
+    # Read-only lookup: select just the serialized columns as a Row, so no
+    # User instance is built or added to the identity map. The username
+    # UNIQUE constraint's index serves the WHERE.
+    user = g.db_session.execute(
+        select(User.id, User.username, User.email, User.created_at)
+        .where(User.username == username)
+    ).one_or_none()
 
-    if not user:
+    if user is None:
         raise AppError(
             ErrorCode.USER_NOT_FOUND,
             f"User '{username}' not found.",
             404
         )
 
-    return jsonify({
+    response = jsonify({
         "data": {
             "id": user.id,
             "username": user.username,
@@ -31,4 +35,10 @@ def get_user_by_username(username: str):
             "created_at": user.created_at.isoformat()
         },
         "warnings": []
-    }), 200
\ No newline at end of file
+    })
+    # Usernames and profiles are immutable through the API, so repeat
+    # lookups (e.g. while adding members) can be served from the client's
+    # own cache. private: the response is only for this bearer token.
+    response.cache_control.private = True
+    response.cache_control.max_age = _LOOKUP_MAX_AGE_SECONDS
+    return response, 200
\ No newline at end of file
@@ -20,6 +20,11 @@ from marshmallow import Schema, ValidationError, fields, validates, validate
 from backend.app.errors import ErrorCode
 
 
+# Compiled once at import. \Z rather than $: "$" also matches before a
+# trailing newline, which would let "alice\n" through.
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9_]+\Z")
+
+
 class RegisterSchema(Schema):
     """
     POST /auth/register
@@ -36,6 +41,7 @@ class RegisterSchema(Schema):
     # Spec: VARCHAR(50) NOT NULL UNIQUE, alphanumeric + underscore, 3–50 chars.
     username = fields.Str(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         validate=[
             validate.Length(
                 min=3,
@@ -43,7 +49,7 @@ class RegisterSchema(Schema):
                 error="Username must be between 3 and 50 characters.",
             ),
             validate.Regexp(
-                r"^[a-zA-Z0-9_]+$",
+                _USERNAME_RE,
                 error="Username may only contain letters, numbers, and underscores.",
             ),
         ],
@@ -53,12 +59,17 @@ class RegisterSchema(Schema):
     # marshmallow's Email field applies RFC-5322-compatible validation.
     email = fields.Email(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         validate=validate.Length(max=255),
     )
 
     # Spec: min 8 chars, at least one letter and one digit.
     # Validated in @validates below to produce a clear message per missing rule.
-    password = fields.Str(required=True, load_only=True)
+    password = fields.Str(
+        required=True,
+        load_only=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
+    )
 
     @validates("password")
     def validate_password_strength(self, value: str) -> None:
@@ -68,9 +79,20 @@ class RegisterSchema(Schema):
         """
         if len(value) < 8:
             raise ValidationError("Password must be at least 8 characters long.")
-        if not any(c.isalpha() for c in value):
+
+        # One pass for both character classes, stopping once both are seen.
+        has_alpha = has_digit = False
+        for c in value:
+            if c.isalpha():
+                has_alpha = True
+            elif c.isdigit():
+                has_digit = True
+            if has_alpha and has_digit:
+                break
+
+        if not has_alpha:
             raise ValidationError("Password must contain at least one letter.")
-        if not any(c.isdigit() for c in value):
+        if not has_digit:
             raise ValidationError("Password must contain at least one digit.")
 
 
@@ -82,8 +104,15 @@ class LoginSchema(Schema):
     is checked in auth_service.py (INVALID_CREDENTIALS, 401).
     """
 
-    username = fields.Str(required=True)
-    password = fields.Str(required=True, load_only=True)
+    username = fields.Str(
+        required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
+    )
+    password = fields.Str(
+        required=True,
+        load_only=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
+    )
 
 
 class RefreshTokenSchema(Schema):
@@ -95,4 +124,7 @@ class RefreshTokenSchema(Schema):
     auth_service.py (REFRESH_TOKEN_INVALID, 401).
     """
 
-    refresh_token = fields.Str(required=True)
\ No newline at end of file
+    refresh_token = fields.Str(
+        required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
+    )
\ No newline at end of file
@@ -47,8 +47,16 @@ from backend.app.models.expense import Category, SplitMode
 #
 # ARCHITECTURE.md Section 4 notes: "INV-7 — marshmallow schema is the
 # enforcement point for precision."
+#
+# The exponent test is deliberately not value == value.quantize(0.01):
+# that accepts "10.100" (equal value, three places written), and quantize
+# raises InvalidOperation instead of failing validation once a huge input
+# exceeds the context precision.
 # ──────────────────────────────────────────────────────────────────────────
 
+_ZERO = Decimal("0")
+
+
 def _validate_monetary_amount(value: Decimal) -> None:
     """
     Validates a monetary Decimal value per INV-7 rules:
@@ -58,7 +66,7 @@ def _validate_monetary_amount(value: Decimal) -> None:
     The route error handler detects INVALID_AMOUNT_PRECISION by matching the
     raised ValidationError message to the known ErrorCode constant.
     """
-    if value <= Decimal("0"):
+    if value <= _ZERO:
         raise ValidationError("Amount must be greater than zero.")
 
     # Decimal.as_tuple().exponent gives the scale (number of decimal places
@@ -83,10 +91,24 @@ def _validate_non_empty_after_trim(value: str) -> None:
     Mirrors the DB CHECK(LENGTH(TRIM(...)) > 0) constraint at the API layer.
     GUIDE Rule 4: the schema is the primary gate; the DB constraint is the last resort.
     """
-    if not value.strip():
+    # Only strip() (and copy) when the first character is whitespace.
+    if not value or (value[0].isspace() and not value.strip()):
         raise ValidationError("This field must not be blank or contain only whitespace.")
 
 
+# ── Shared duplicate-user check ───────────────────────────────────────────
+
+def _has_duplicate_user(splits: list[dict]) -> bool:
+    """True if any user_id appears twice. Stops at the first repeat."""
+    seen: set[int] = set()
+    for s in splits:
+        user_id = s["user_id"]
+        if user_id in seen:
+            return True
+        seen.add(user_id)
+    return False
+
+
 # ── Sub-schema: one entry in the `splits` array ───────────────────────────
 
 class SplitInputSchema(Schema):
@@ -100,6 +122,7 @@ class SplitInputSchema(Schema):
 
     user_id = fields.Int(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         strict=True,   # reject floats like 1.0
         validate=validate.Range(min=1, error="user_id must be a positive integer."),
     )
@@ -107,6 +130,7 @@ class SplitInputSchema(Schema):
     # INV-7: Decimal, strictly positive, max 2 dp.
     amount = fields.Decimal(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         validate=_validate_monetary_amount,
     )
 
@@ -139,6 +163,7 @@ class CreateExpenseSchema(Schema):
     # Spec: integer, required, must be a group member (INV-5 — checked in service).
     paid_by_user_id = fields.Int(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         strict=True,
         validate=validate.Range(min=1, error="paid_by_user_id must be a positive integer."),
     )
@@ -146,6 +171,7 @@ class CreateExpenseSchema(Schema):
     # Spec: non-empty after trim, max 255 chars.
     description = fields.Str(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         validate=[
             validate.Length(
                 min=1,
@@ -159,6 +185,7 @@ class CreateExpenseSchema(Schema):
     # INV-7: Decimal, strictly positive, max 2 dp.
     amount = fields.Decimal(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         validate=_validate_monetary_amount,
     )
 
@@ -229,8 +256,7 @@ class CreateExpenseSchema(Schema):
                 )
 
             # Custom mode: check for duplicate user_ids within the splits array.
-            user_ids = [s["user_id"] for s in splits]
-            if len(user_ids) != len(set(user_ids)):
+            if _has_duplicate_user(splits):
                 raise ValidationError(
                     {
                         "splits": [ErrorCode.DUPLICATE_SPLIT_USER],
@@ -375,8 +401,7 @@ class PatchExpenseSchema(Schema):
 
         # ── Rule C: no duplicate user_ids in the splits array ─────────────
         if splits is not None:
-            user_ids = [s["user_id"] for s in splits]
-            if len(user_ids) != len(set(user_ids)):
+            if _has_duplicate_user(splits):
                 raise ValidationError(
                     {
                         "splits": [ErrorCode.DUPLICATE_SPLIT_USER],
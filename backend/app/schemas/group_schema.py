@@ -17,6 +17,8 @@ from __future__ import annotations
 
 from marshmallow import Schema, ValidationError, fields, validate, validates
 
+from backend.app.errors import ErrorCode
+
 
 # ── Shared non-empty string validator ─────────────────────────────────────
 #
@@ -32,7 +34,9 @@ def _validate_non_empty_after_trim(value: str) -> None:
     Raises ValidationError if the string is blank or contains only whitespace.
     Mirrors the DB CHECK(LENGTH(TRIM(...)) > 0) constraint at the API layer.
     """
-    if not value.strip():
+    # A non-whitespace first character already rules out a blank string,
+    # so the strip() copy is only made when the value starts with whitespace.
+    if not value or (value[0].isspace() and not value.strip()):
         raise ValidationError("This field must not be blank or contain only whitespace.")
 
 
@@ -51,6 +55,7 @@ class CreateGroupSchema(Schema):
     # Spec: VARCHAR(100) NOT NULL CHECK(LENGTH(TRIM(name)) > 0)
     name = fields.Str(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         validate=[
             validate.Length(
                 min=1,
@@ -75,6 +80,7 @@ class AddMemberSchema(Schema):
     # (USER_NOT_FOUND, 404) — checked in group_service.py.
     user_id = fields.Int(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         strict=True,  # reject floats like 1.0 — integers only
         validate=validate.Range(
             min=1,
@@ -35,6 +35,9 @@ from backend.app.errors import ErrorCode
 # makes unit testing harder to isolate).
 # ──────────────────────────────────────────────────────────────────────────
 
+_ZERO = Decimal("0")
+
+
 def _validate_monetary_amount(value: Decimal) -> None:
     """
     Validates a monetary Decimal value per INV-7 (spec Section 4):
@@ -45,7 +48,7 @@ def _validate_monetary_amount(value: Decimal) -> None:
     — never rounded. This matches the spec's explicit rule and the DB column
     type NUMERIC(12, 2).
     """
-    if value <= Decimal("0"):
+    if value <= _ZERO:
         raise ValidationError("Amount must be greater than zero.")
 
     # Decimal.as_tuple().exponent gives the scale as a negative integer.
@@ -84,6 +87,7 @@ class CreateSettlementSchema(Schema):
     # Must be a positive integer. Existence and membership are DB concerns.
     paid_to_user_id = fields.Int(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         strict=True,   # reject floats like 1.0 — integers only
         validate=validate.Range(
             min=1,
@@ -95,5 +99,6 @@ class CreateSettlementSchema(Schema):
     # INV-3: Overpayment is valid — not checked here.
     amount = fields.Decimal(
         required=True,
+        error_messages={"required": ErrorCode.MISSING_FIELD},
         validate=_validate_monetary_amount,
     )
\ No newline at end of file
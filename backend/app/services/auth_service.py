@@ -10,7 +10,9 @@ Responsibilities:
 Layer rules (GUIDE Rule 3):
   - No imports from routes or schemas
   - No use of flask.request, flask.g, or HTTP status codes
-  - current_app.config is used ONLY to read JWT_SECRET_KEY and JWT expiry —
+  - current_app is used ONLY to read the JWT secret, algorithm and expiry
+    (resolved once by create_app into app.extensions["_jwt_issue_params"])
+    and BCRYPT_LOG_ROUNDS —
     this is the single Flask dependency in this service, justified because:
     (a) auth_service is only integration-tested (never unit-tested without an
         app context), and (b) JWT secrets must not be hardcoded or read from
@@ -36,7 +38,7 @@ from datetime import datetime, timezone
 import bcrypt
 import jwt
 from flask import current_app
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -47,20 +49,24 @@ from backend.app.models.user import User
 
 # ── Private helpers ────────────────────────────────────────────────────────
 
-def _hash_token(raw_token: str) -> str:
-    """SHA-256 hex digest of a raw token string. Used for refresh token storage."""
-    return hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+def _hash_token(raw_token: str) -> bytes:
+    """
+    SHA-256 digest (32 raw bytes) of a raw token string. Used for refresh
+    token storage; the column is BYTEA, so no hex encoding is needed.
+    """
+    return hashlib.sha256(raw_token.encode("utf-8")).digest()
 
 
 def _create_access_token(user_id: int) -> str:
     """
     Creates a signed JWT access token.
     Payload: sub (user_id as str), iat, exp, jti.
-    Algorithm: HS256. Secret from current_app.config["JWT_SECRET_KEY"].
-    TTL from current_app.config["JWT_ACCESS_TOKEN_EXPIRES"] (timedelta).
+    Secret, algorithm (HS256) and TTL come from the issuance parameters
+    create_app() caches in app.extensions — one lookup instead of three.
     """
+    secret, algorithm, access_ttl, _ = current_app.extensions["_jwt_issue_params"]
     now = datetime.now(timezone.utc)
-    expiry = now + current_app.config["JWT_ACCESS_TOKEN_EXPIRES"]
+    expiry = now + access_ttl
     payload = {
         "sub": str(user_id),
         "iat": now,
@@ -68,11 +74,7 @@ def _create_access_token(user_id: int) -> str:
         # Guarantees each issued token is unique even if generated in the same second.
         "jti": secrets.token_hex(8),
     }
-    return jwt.encode(
-        payload,
-        current_app.config["JWT_SECRET_KEY"],
-        algorithm=current_app.config.get("JWT_ALGORITHM", "HS256"),
-    )
+    return jwt.encode(payload, secret, algorithm=algorithm)
 
 
 def _create_refresh_token(user_id: int, session: Session) -> str:
@@ -85,7 +87,8 @@ def _create_refresh_token(user_id: int, session: Session) -> str:
     """
     raw_token = secrets.token_hex(32)
     token_hash = _hash_token(raw_token)
-    expires_at = datetime.now(timezone.utc) + current_app.config["JWT_REFRESH_TOKEN_EXPIRES"]
+    refresh_ttl = current_app.extensions["_jwt_issue_params"][3]
+    expires_at = datetime.now(timezone.utc) + refresh_ttl
 
     refresh_token = RefreshToken(
         user_id=user_id,
@@ -135,21 +138,26 @@ def register_user(
     Returns: {"user": {...}, "access_token": "...", "refresh_token": "..."}
     """
     # Cross-entity uniqueness checks (cannot be done in schema — require DB).
-    existing_email = session.execute(
-        select(User).where(User.email == email)
-    ).scalar_one_or_none()
-    if existing_email is not None:
+    # One round trip covers both unique columns; at most two rows come back.
+    # Email is reported first when both collide. The checks stay ahead of
+    # bcrypt so a duplicate never pays for a hash.
+    # lambda_stmt: the statement is built and compiled once per process;
+    # later calls only re-bind the closure variables (email / username).
+    clashes = session.execute(
+        lambda_stmt(
+            lambda: select(User.email, User.username).where(
+                or_(User.email == email, User.username == username)
+            )
+        )
+    ).all()
+    if any(row.email == email for row in clashes):
         raise AppError(
             ErrorCode.DUPLICATE_EMAIL,
             f"The email address '{email}' is already registered.",
             409,
             field="email",
         )
-
-    existing_username = session.execute(
-        select(User).where(User.username == username)
-    ).scalar_one_or_none()
-    if existing_username is not None:
+    if clashes:
         raise AppError(
             ErrorCode.DUPLICATE_USERNAME,
             f"The username '{username}' is already taken.",
@@ -194,7 +202,7 @@ def login_user(
     Returns: {"user": {...}, "access_token": "...", "refresh_token": "..."}
     """
     user = session.execute(
-        select(User).where(User.username == username)
+        lambda_stmt(lambda: select(User).where(User.username == username))
     ).scalar_one_or_none()
 
     # Constant-time password comparison prevents timing-based username enumeration.
@@ -236,9 +244,17 @@ def refresh_access_token(
     token_hash = _hash_token(raw_refresh_token)
     now = datetime.now(timezone.utc)
 
+    # Only columns carried by idx_refresh_tokens_hash_covering are selected,
+    # so PostgreSQL can answer from the index without visiting the table.
     record = session.execute(
-        select(RefreshToken).where(RefreshToken.token_hash == token_hash)
-    ).scalar_one_or_none()
+        lambda_stmt(
+            lambda: select(
+                RefreshToken.user_id,
+                RefreshToken.expires_at,
+                RefreshToken.revoked,
+            ).where(RefreshToken.token_hash == token_hash)
+        )
+    ).one_or_none()
 
     if record is None or record.revoked or record.expires_at <= now:
         raise AppError(
@@ -268,20 +284,27 @@ def logout_user(
     """
     token_hash = _hash_token(raw_refresh_token)
 
-    record = session.execute(
-        select(RefreshToken).where(RefreshToken.token_hash == token_hash)
+    # One conditional UPDATE instead of SELECT + flush: a missing token and
+    # an already-revoked one both match no row, so RETURNING comes back empty.
+    # No RefreshToken is loaded in this session, so there is nothing to sync.
+    revoked_id = session.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked.is_(False),
+        )
+        .values(revoked=True)
+        .returning(RefreshToken.id)
+        .execution_options(synchronize_session=False)
     ).scalar_one_or_none()
 
-    if record is None or record.revoked:
+    if revoked_id is None:
         raise AppError(
             ErrorCode.REFRESH_TOKEN_INVALID,
             "The refresh token is invalid or has already been revoked.",
             401,
         )
 
-    record.revoked = True
-    session.flush()
-
 
 def get_current_user(user_id: int, session: Session) -> dict:
     """
@@ -13,168 +13,150 @@ Layer rules (GUIDE Rule 3):
   - Fully unit-testable without a Flask app or HTTP context.
 
 INV-8 enforcement:
-  - get_active_expenses() ALWAYS filters WHERE deleted_at IS NULL.
-  - All functions that read expense amounts use get_active_expenses().
+  - Balances read expense amounts only through _ledger_cte(), which
+    filters WHERE deleted_at IS NULL.
   - Direct queries on the Expense model without this filter are FORBIDDEN
     in any balance-related context. (GUIDE Rule 8)
 
+Balance computation has one form: the ledger CTE in _ledger_cte(), summed
+per user by get_member_balances(). That single statement also carries group
+existence, usernames and membership, so get_balance_response() needs one
+round trip.
+
 INV-2 guarantee:
-  - compute_balances() is mathematically guaranteed to produce sum == 0
-    when INV-1 holds for all active expenses. The route asserts this
-    before responding; a non-zero sum surfaces as a 500.
+  - The unfiltered ledger sums to zero whenever INV-1 holds for all active
+    expenses: every expense row's credit is matched by its splits' debits,
+    and every settlement contributes +amount and -amount.
+    get_balance_response() asserts this before responding; a non-zero sum
+    surfaces as a 500.
 """
 
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import CTE, Numeric, Row, func, literal, select, true, union_all
 from sqlalchemy.orm import Session
 
 from backend.app.errors import AppError, ErrorCode
 from backend.app.models.expense import Category, Expense
+from backend.app.models.group import Group
 from backend.app.models.membership import Membership
 from backend.app.models.settlement import Settlement
 from backend.app.models.split import Split
 from backend.app.models.user import User
 
 
-# ── Data access helpers ────────────────────────────────────────────────────
-# These are the ONLY sanctioned ways to query expense/split data for
-# balance purposes. They exist to enforce INV-8 at the query level.
-
-def get_active_expenses(
-        group_id: int,
-        session: Session,
-        category: Category | None = None,
-) -> list[Expense]:
+# ── Canonical balance formula ──────────────────────────────────────────────
+#
+# The one definition of a balance (ARCHITECTURE.md Section 6). Each row of
+# the "ledger" CTE is one signed movement for one user; a user's balance is
+# the SUM of their rows. PostgreSQL does the summing, so the service only
+# handles O(members) rows and NUMERIC sums come back as Decimal (GUIDE Rule 2).
+#
+#   1. Credit each payer for the full expense amount they fronted.
+#   2. Debit each participant for their split amount.
+#   3. Net all settlements (payer gains credit, recipient loses credit).
+#   4. Ensure every member appears even if their balance is exactly zero.
+#
+# Category filter: settlements are cross-category, so step 3 is skipped
+# when a category is given and the filtered balances do NOT sum to zero.
+# ──────────────────────────────────────────────────────────────────────────
+
+def _ledger_cte(group_id: int, category: Category | None = None) -> CTE:
     """
-    Returns expenses for a group WHERE deleted_at IS NULL (INV-8).
+    The "ledger" CTE behind get_member_balances(): one signed
+    (user_id, share) row per balance movement (steps 1–3) plus a 0.00 row
+    per current member (step 4). is_member is true only on the step-4 rows.
 
-    Args:
-        category: Optional filter. When provided, only expenses of that
-                  category are included. This is used for the informational
-                  category-scoped balance view (spec Section 8.4).
-                  IMPORTANT: category filtering is informational only —
-                  balance_sum will NOT be zero for a filtered result because
-                  settlements are not category-scoped.
+    INV-8: expense and split rows come only from deleted_at IS NULL
+    expenses — never bypass this CTE to read expense amounts.
     """
-    stmt = (
-        select(Expense)
-        .where(
-            Expense.group_id == group_id,
-            Expense.deleted_at.is_(None),  # INV-8: exclude soft-deleted
-        )
-    )
+    active_expense = [
+        Expense.group_id == group_id,
+        Expense.deleted_at.is_(None),  # INV-8
+    ]
     if category is not None:
-        stmt = stmt.where(Expense.category == category)
+        active_expense.append(Expense.category == category)
+
+    ledger_parts = [
+        # Step 1: payer credited the full expense amount.
+        select(
+            Expense.paid_by_user_id.label("user_id"),
+            Expense.amount.label("share"),
+            literal(False).label("is_member"),
+        ).where(*active_expense),
+        # Step 2: each participant debited their split.
+        select(Split.user_id, -Split.amount, literal(False))
+        .join(Expense, Split.expense_id == Expense.id)
+        .where(*active_expense),
+        # Step 4: every member appears, even at exactly zero.
+        select(
+            Membership.user_id,
+            literal(Decimal("0.00"), Numeric(12, 2)),
+            literal(True),
+        ).where(Membership.group_id == group_id),
+    ]
+    if category is None:
+        # Step 3: settlements — payer gains credit, recipient loses it.
+        ledger_parts += [
+            select(Settlement.paid_by_user_id, Settlement.amount, literal(False))
+            .where(Settlement.group_id == group_id),
+            select(Settlement.paid_to_user_id, -Settlement.amount, literal(False))
+            .where(Settlement.group_id == group_id),
+        ]
 
-    return list(session.execute(stmt).scalars().all())
+    return union_all(*ledger_parts).cte("ledger")
 
 
-def get_splits_for_active_expenses(
+def get_member_balances(
         group_id: int,
         session: Session,
         category: Category | None = None,
-) -> list[Split]:
+) -> list[Row] | None:
     """
-    Returns splits belonging to active (non-deleted) expenses in a group.
+    Everything get_balance_response() reads from the database, in one
+    statement: whether the group exists and, per user, the net balance (the
+    ledger CTE summed), the username, and whether they are a current member
+    (for INV-9 and display names).
+
+    The per-user aggregate is outer-joined onto the groups row, so a missing
+    group yields no rows at all while an existing group always yields at
+    least one (NULL-padded if it has no ledger rows).
 
-    Joins Split → Expense to enforce the INV-8 filter. Does not query
-    Expense directly without the deleted_at filter.
+    Returns None if the group does not exist, else rows of
+    (user_id, username, is_member, balance), ordered by user_id.
     """
-    stmt = (
-        select(Split)
-        .join(Expense, Split.expense_id == Expense.id)
-        .where(
-            Expense.group_id == group_id,
-            Expense.deleted_at.is_(None),  # INV-8
+    ledger = _ledger_cte(group_id, category)
+    per_user = (
+        select(
+            ledger.c.user_id,
+            User.username,
+            func.bool_or(ledger.c.is_member).label("is_member"),
+            func.sum(ledger.c.share).label("balance"),
         )
+        .select_from(ledger)
+        .join(User, User.id == ledger.c.user_id)
+        .group_by(ledger.c.user_id, User.username)
+        .subquery("per_user")
     )
-    if category is not None:
-        stmt = stmt.where(Expense.category == category)
-
-    return list(session.execute(stmt).scalars().all())
-
-
-def get_settlements(group_id: int, session: Session) -> list[Settlement]:
-    """Returns all settlements for a group. Settlements have no soft-delete."""
-    stmt = select(Settlement).where(Settlement.group_id == group_id)
-    return list(session.execute(stmt).scalars().all())
-
-
-def get_member_ids(group_id: int, session: Session) -> list[int]:
-    """Returns the user_ids of all current members of a group."""
-    stmt = select(Membership.user_id).where(Membership.group_id == group_id)
-    return list(session.execute(stmt).scalars().all())
-
-
-def get_members(group_id: int, session: Session) -> list[User]:
-    """Returns full User objects for all current group members."""
     stmt = (
-        select(User)
-        .join(Membership, User.id == Membership.user_id)
-        .where(Membership.group_id == group_id)
+        select(
+            per_user.c.user_id,
+            per_user.c.username,
+            per_user.c.is_member,
+            per_user.c.balance,
+        )
+        .select_from(Group)
+        .outerjoin(per_user, true())
+        .where(Group.id == group_id)
+        .order_by(per_user.c.user_id)
     )
-    return list(session.execute(stmt).scalars().all())
-
-
-# ── Core algorithms ────────────────────────────────────────────────────────
-
-def compute_balances(
-        group_id: int,
-        session: Session,
-        category: Category | None = None,
-) -> dict[int, Decimal]:
-    """
-    Canonical balance computation for a group. (ARCHITECTURE.md Section 6)
-
-    Returns {user_id: net_balance} for every current member.
-
-    Algorithm:
-      1. Credit each payer for the full expense amount they fronted.
-      2. Debit each participant for their split amount.
-      3. Net all settlements (payer gains credit, recipient loses credit).
-      4. Ensure every member appears even if their balance is exactly zero.
-
-    INV-8: Only active (deleted_at IS NULL) expenses are included.
-           This is enforced through get_active_expenses() and
-           get_splits_for_active_expenses() — never bypass these helpers.
-
-    INV-2: sum(return_value.values()) == Decimal("0.00") for a full
-           (non-category-filtered) computation. This is a mathematical
-           consequence of INV-1 and is asserted by the caller (the route
-           or the test) before using the result.
-
-    Category filter note:
-      When category is provided, settlements are NOT filtered — they are
-      cross-category. As a result, sum(balances) will NOT be zero for
-      a category-filtered result. The caller must NOT assert INV-2 on
-      category-filtered results.
-    """
-    balances: dict[int, Decimal] = defaultdict(Decimal)
-
-    # Step 1: Credit payer for the full expense amount they fronted.
-    for expense in get_active_expenses(group_id, session, category):
-        balances[expense.paid_by_user_id] += expense.amount
-
-    # Step 2: Debit each participant for their split portion.
-    for split in get_splits_for_active_expenses(group_id, session, category):
-        balances[split.user_id] -= split.amount
-
-    # Step 3: Net settlements. Only included when no category filter is active,
-    # because settlements are cross-category and would distort the filtered view.
-    if category is None:
-        for settlement in get_settlements(group_id, session):
-            balances[settlement.paid_by_user_id] += settlement.amount
-            balances[settlement.paid_to_user_id] -= settlement.amount
-
-    # Step 4: Ensure every member appears, even if their net balance is zero.
-    for member_id in get_member_ids(group_id, session):
-        balances.setdefault(member_id, Decimal("0.00"))
-
-    return dict(balances)
+    rows = session.execute(stmt).all()
+    if not rows:
+        return None
+    return [r for r in rows if r.user_id is not None]
 
 
 def simplify_debts(balances: dict[int, Decimal]) -> list[dict]:
@@ -186,7 +168,7 @@ def simplify_debts(balances: dict[int, Decimal]) -> list[dict]:
     all balances reach zero. For N members, produces at most N-1 transactions.
 
     Args:
-        balances: {user_id: net_balance} from compute_balances().
+        balances: {user_id: net_balance} from get_member_balances().
                   MUST satisfy sum(balances.values()) == 0 (INV-2).
                   Passing a category-filtered result violates this contract.
 
@@ -194,39 +176,31 @@ def simplify_debts(balances: dict[int, Decimal]) -> list[dict]:
         List of {"from_user_id": int, "to_user_id": int, "amount": Decimal}
         An empty list means all balances are already zero.
     """
-    # Build mutable sorted lists: largest creditor first, largest debtor first.
-    creditors = sorted(
-        [(uid, amt) for uid, amt in balances.items() if amt > 0],
-        key=lambda x: x[1],
-        reverse=True,
-    )
-    debtors = sorted(
-        [(uid, -amt) for uid, amt in balances.items() if amt < 0],
-        key=lambda x: x[1],
-        reverse=True,
-    )
+    # Max-heaps via negated amounts; ties break on the smaller user_id, so
+    # the output is deterministic for a given balance map.
+    creditors = [(-amt, uid) for uid, amt in balances.items() if amt > 0]
+    debtors = [(amt, uid) for uid, amt in balances.items() if amt < 0]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
 
     transactions: list[dict] = []
-    i = j = 0
 
-    while i < len(creditors) and j < len(debtors):
-        cid, credit = creditors[i]
-        did, debt = debtors[j]
+    while creditors and debtors:
+        neg_credit, cid = heapq.heappop(creditors)
+        neg_debt, did = heapq.heappop(debtors)
 
-        transfer = min(credit, debt)
+        transfer = min(-neg_credit, -neg_debt)
         transactions.append({
             "from_user_id": did,
             "to_user_id": cid,
             "amount": transfer,
         })
 
-        creditors[i] = (cid, credit - transfer)
-        debtors[j] = (did, debt - transfer)
-
-        if creditors[i][1] == Decimal("0"):
-            i += 1
-        if debtors[j][1] == Decimal("0"):
-            j += 1
+        # Only the side that was not fully settled goes back on its heap.
+        if neg_credit + transfer:
+            heapq.heappush(creditors, (neg_credit + transfer, cid))
+        if neg_debt + transfer:
+            heapq.heappush(debtors, (neg_debt + transfer, did))
 
     return transactions
 
@@ -249,10 +223,9 @@ def get_balance_response(
         AppError(FORBIDDEN, 403)        -- caller not a group member (INV-9).
         AppError(INTERNAL_ERROR, 500)   -- INV-2 violated on unfiltered computation.
     """
-    # Verify group exists.
-    from backend.app.models.group import Group  # local import to avoid circular dep
-    group = session.get(Group, group_id)
-    if group is None:
+    # One round trip: group existence, membership, names and balances.
+    rows = get_member_balances(group_id, session, category)
+    if rows is None:
         raise AppError(
             ErrorCode.GROUP_NOT_FOUND,
             f"Group {group_id} does not exist.",
@@ -260,17 +233,16 @@ def get_balance_response(
         )
 
     # INV-9: caller must be a member of the group.
-    caller_is_member = caller_id in get_member_ids(group_id, session)
-    if not caller_is_member:
+    if not any(r.is_member and r.user_id == caller_id for r in rows):
         raise AppError(
             ErrorCode.FORBIDDEN,
             f"You are not a member of group {group_id}.",
             403,
         )
 
-    balances = compute_balances(group_id, session, category)
-    members = get_members(group_id, session)
-    member_map = {m.id: m.username for m in members}
+    balances = {r.user_id: r.balance for r in rows}
+    # Former members keep their balance but are shown as user_<id>.
+    member_map = {r.user_id: r.username for r in rows if r.is_member}
 
     balance_list = [
         {
@@ -281,11 +253,13 @@ def get_balance_response(
         for uid, bal in balances.items()
     ]
 
+    # Summed once: reported as balance_sum and, unfiltered, checked for INV-2.
+    balance_sum = sum(balances.values(), Decimal("0.00"))
+
     # INV-2 assertion: sum of all balances MUST be zero for the full computation.
     # Category-filtered results are explicitly excluded from this check because
     # they intentionally omit cross-category settlements.
     if category is None:
-        balance_sum = sum(balances.values(), Decimal("0.00"))
         if balance_sum != Decimal("0.00"):
             # This is a 500 — it means source data is corrupt.
             # The error handler will log the full context.
@@ -311,11 +285,9 @@ def get_balance_response(
         # For category-filtered view, simplified debts are not meaningful.
         simplified_debts = []
 
-    final_sum = sum(balances.values(), Decimal("0.00"))
-
     return {
         "group_id": group_id,
         "balances": balance_list,
         "simplified_debts": simplified_debts,
-        "balance_sum": str(final_sum),
+        "balance_sum": str(balance_sum),
     }
\ No newline at end of file
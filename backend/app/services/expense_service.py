@@ -14,6 +14,7 @@ Authorization rules:
   - Get:    caller must be a member of the expense's group (INV-9)
   - Edit:   caller must be the original payer OR the group owner (spec Section 7.2)
   - Delete: caller must be the original payer OR the group owner (consistent with edit)
+  - Replace (legacy PUT): caller must be the original payer
 
 Equal split computation (spec Section 9.2):
   - Server divides amount among ALL current group members using ROUND_DOWN.
@@ -29,10 +30,12 @@ Layer rules (GUIDE Rule 3):
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from decimal import Decimal, ROUND_DOWN
+from decimal import Decimal
+from typing import Iterable
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from backend.app.errors import AppError, ErrorCode
 from backend.app.models.expense import Category, Expense, SplitMode
@@ -42,11 +45,34 @@ from backend.app.models.split import Split
 from backend.app.models.user import User
 
 
+# ── Read-path loader options ───────────────────────────────────────────────
+#
+# Everything _serialize_expense() in the route touches: the payer and, per
+# split, the split's user. Any other relationship access raises
+# InvalidRequestError instead of silently emitting a lazy SELECT per row, so
+# a serializer change that needs more data fails loudly in tests.
+# Used on read paths, and by create/edit only for the final reload once
+# every write has been flushed (_reload_for_response).
+# ──────────────────────────────────────────────────────────────────────────
+
+_EXPENSE_READ_OPTIONS = (
+    joinedload(Expense.payer),
+    selectinload(Expense.splits).joinedload(Split.user),
+    raiseload("*"),
+)
+
+# Rows fetched (and selectin-loaded) per round trip when streaming a list.
+_LIST_BATCH_SIZE = 100
+
+
 # ── Private helpers ────────────────────────────────────────────────────────
 
 def _get_group_or_404(group_id: int, session: Session) -> Group:
-    """Returns the Group or raises GROUP_NOT_FOUND (404)."""
-    group = session.get(Group, group_id)
+    """
+    Returns the Group or raises GROUP_NOT_FOUND (404).
+    Loaded together with the member list (see _load_group_and_members).
+    """
+    group, _ = _load_group_and_members(group_id, session)
     if group is None:
         raise AppError(
             ErrorCode.GROUP_NOT_FOUND,
@@ -56,9 +82,16 @@ def _get_group_or_404(group_id: int, session: Session) -> Group:
     return group
 
 
-def _get_expense_or_404(expense_id: int, session: Session) -> Expense:
-    """Returns the Expense (active or deleted) or raises EXPENSE_NOT_FOUND (404)."""
-    expense = session.get(Expense, expense_id)
+def _get_expense_or_404(
+        expense_id: int,
+        session: Session,
+        options: tuple = (),
+) -> Expense:
+    """
+    Returns the Expense (active or deleted) or raises EXPENSE_NOT_FOUND (404).
+    options are passed through to session.get() (e.g. _EXPENSE_READ_OPTIONS).
+    """
+    expense = session.get(Expense, expense_id, options=options)
     if expense is None:
         raise AppError(
             ErrorCode.EXPENSE_NOT_FOUND,
@@ -68,19 +101,97 @@ def _get_expense_or_404(expense_id: int, session: Session) -> Expense:
     return expense
 
 
+# ── Per-session group + membership cache ───────────────────────────────────
+#
+# create/edit/delete need the group row (existence, owner), the caller's
+# membership, and the full member list for INV-5/INV-6 and equal splits.
+# One query loads the group with its member ids aggregated alongside, and
+# the pair is kept in session.info, which lives exactly as long as the
+# request's Session (Flask-SQLAlchemy removes it at app-context teardown).
+# Whichever of _get_group_or_404 / _require_member runs first pays for the
+# query (edit/delete seed it while loading the expense); the rest are
+# cache hits. This service never adds or removes
+# memberships, so the cached list cannot go stale under it.
+# ──────────────────────────────────────────────────────────────────────────
+
+_GROUP_CACHE_KEY = "expense_service.group_members"
+
+
+def _load_group_and_members(
+        group_id: int,
+        session: Session,
+) -> tuple[Group | None, frozenset[int]]:
+    """
+    Returns (group, member_user_ids), querying at most once per session.
+    group is None (and the ids empty) if the group does not exist.
+    """
+    cache = session.info.setdefault(_GROUP_CACHE_KEY, {})
+    cached = cache.get(group_id)
+    if cached is None:
+        stmt = (
+            select(Group, func.array_agg(Membership.user_id))
+            .outerjoin(Membership, Membership.group_id == Group.id)
+            .where(Group.id == group_id)
+            .group_by(Group.id)
+        )
+        row = session.execute(stmt).one_or_none()
+        if row is None:
+            cached = cache[group_id] = (None, frozenset())
+        else:
+            cached = _cache_group_members(session, *row)
+    return cached
+
+
+def _cache_group_members(
+        session: Session,
+        group: Group,
+        user_ids: list[int | None],
+) -> tuple[Group, frozenset[int]]:
+    """Stores an aggregated group + member ids row in the session cache."""
+    # A group with no memberships aggregates to {NULL}.
+    cached = (group, frozenset(uid for uid in user_ids if uid is not None))
+    session.info.setdefault(_GROUP_CACHE_KEY, {})[group.id] = cached
+    return cached
+
+
+def _get_expense_for_write_or_404(expense_id: int, session: Session) -> Expense:
+    """
+    Returns the Expense (active or deleted) or raises EXPENSE_NOT_FOUND (404),
+    loading its group and member ids in the same query.
+
+    edit/delete need all three before any write: membership (INV-9), the
+    owner (authorization) and, on edit, the member list (INV-5/INV-6). The
+    group half is cached as by _load_group_and_members(), so the later
+    _require_member / _get_group_or_404 / _get_member_ids calls are hits.
+    """
+    stmt = (
+        select(Expense, Group, func.array_agg(Membership.user_id))
+        .join(Group, Group.id == Expense.group_id)
+        .outerjoin(Membership, Membership.group_id == Group.id)
+        .where(Expense.id == expense_id)
+        .group_by(Expense.id, Group.id)
+        # edit/delete read only columns from here on (relationships come
+        # back via _reload_for_response), so a lazy load would be a bug.
+        .options(raiseload("*"))
+    )
+    row = session.execute(stmt).one_or_none()
+    if row is None:
+        raise AppError(
+            ErrorCode.EXPENSE_NOT_FOUND,
+            f"Expense {expense_id} does not exist.",
+            404,
+        )
+    expense, group, user_ids = row
+    _cache_group_members(session, group, user_ids)
+    return expense
+
+
 def _require_member(group_id: int, user_id: int, session: Session) -> None:
     """
     Raises FORBIDDEN (403) if user_id is not a member of group_id.
     INV-9: non-members receive 403, not 404.
     """
-    membership = session.execute(
-        select(Membership).where(
-            Membership.group_id == group_id,
-            Membership.user_id == user_id,
-            )
-    ).scalar_one_or_none()
-
-    if membership is None:
+    if user_id not in _get_member_ids(group_id, session):
         raise AppError(
             ErrorCode.FORBIDDEN,
             f"You are not a member of group {group_id}.",
@@ -88,22 +199,25 @@ def _require_member(group_id: int, user_id: int, session: Session) -> None:
         )
 
 
-def _get_member_ids(group_id: int, session: Session) -> list[int]:
-    """Returns the user_ids of all current members of a group."""
-    stmt = select(Membership.user_id).where(Membership.group_id == group_id)
-    return list(session.execute(stmt).scalars().all())
+def _get_member_ids(group_id: int, session: Session) -> frozenset[int]:
+    """
+    Returns the user_ids of all current members of a group (empty if the
+    group does not exist). Built once per session and shared by every
+    membership check; callers that need an order sort it.
+    """
+    return _load_group_and_members(group_id, session)[1]
 
 
 def _validate_payer_is_member(
         paid_by_user_id: int,
         group_id: int,
-        member_ids: list[int],
+        member_set: frozenset[int],
 ) -> None:
     """
     Raises PAYER_NOT_MEMBER (422) if paid_by_user_id is not in the group.
     INV-5: enforced here because the schema cannot perform DB lookups.
     """
-    if paid_by_user_id not in member_ids:
+    if paid_by_user_id not in member_set:
         raise AppError(
             ErrorCode.PAYER_NOT_MEMBER,
             f"User {paid_by_user_id} is not a member of group {group_id}.",
@@ -115,21 +229,25 @@ def _validate_payer_is_member(
 def _validate_split_users_are_members(
         splits: list[dict],
         group_id: int,
-        member_ids: list[int],
+        member_set: frozenset[int],
 ) -> None:
     """
-    Raises SPLIT_USER_NOT_MEMBER (422) for the first split user not in the group.
+    Raises SPLIT_USER_NOT_MEMBER (422) naming every split user not in the group.
     INV-6: enforced here because the schema cannot perform DB lookups.
     """
-    member_set = set(member_ids)
-    for split in splits:
-        if split["user_id"] not in member_set:
-            raise AppError(
-                ErrorCode.SPLIT_USER_NOT_MEMBER,
-                f"User {split['user_id']} is not a member of group {group_id}.",
-                422,
-                field="splits",
-            )
+    missing = sorted({s["user_id"] for s in splits} - member_set)
+    if len(missing) == 1:
+        message = f"User {missing[0]} is not a member of group {group_id}."
+    elif missing:
+        message = f"Users {missing} are not members of group {group_id}."
+    else:
+        return
+    raise AppError(
+        ErrorCode.SPLIT_USER_NOT_MEMBER,
+        message,
+        422,
+        field="splits",
+    )
 
 
 def _validate_split_sum(
@@ -152,6 +270,34 @@ def _validate_split_sum(
         )
 
 
+def validate_stored_split_sum(
+        expense_id: int,
+        expected_amount: Decimal,
+        session: Session,
+) -> None:
+    """
+    INV-1 over split rows already written with bulk DELETE/INSERT, which
+    bypass _validate_split_sum(). Postgres sums NUMERIC(12,2) exactly, so the
+    check is one scalar round trip with no ORM loads.
+
+    trg_splits_sum_check (migration 002) would also reject the mismatch, but
+    it is DEFERRABLE INITIALLY DEFERRED and only fires at COMMIT as a raw
+    IntegrityError. Checking here surfaces SPLIT_SUM_MISMATCH (422) with the
+    field name before the transaction is committed.
+    """
+    split_total = session.execute(
+        select(func.coalesce(func.sum(Split.amount), 0))
+        .where(Split.expense_id == expense_id)
+    ).scalar_one()
+    if split_total != expected_amount:
+        raise AppError(
+            ErrorCode.SPLIT_SUM_MISMATCH,
+            f"Split amounts ({split_total}) do not equal expense amount ({expected_amount}).",
+            422,
+            field="splits",
+        )
+
+
 def _compute_equal_splits(
         amount: Decimal,
         participant_ids: list[int],
@@ -173,12 +319,14 @@ def _compute_equal_splits(
         List of {"user_id": int, "amount": Decimal} dicts.
     """
     n = len(participant_ids)
-    base = (amount / Decimal(n)).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
-    remainder = amount - (base * n)
+    # Whole cents: amount has at most 2 dp (INV-7), so scaleb(2) is exact and
+    # divmod on positive ints is the ROUND_DOWN quotient plus the remainder.
+    base_cents, remainder_cents = divmod(int(amount.scaleb(2)), n)
+    base = Decimal(base_cents).scaleb(-2)
 
     splits = [{"user_id": uid, "amount": base} for uid in participant_ids]
 
-    if remainder > Decimal("0"):
+    if remainder_cents:
         # Add the remainder to the payer's split. If payer is not in the list
         # (edge case — INV-5 ensures payer is a member; participants = all members),
         # fall back to the first participant.
@@ -186,7 +334,7 @@ def _compute_equal_splits(
             (s for s in splits if s["user_id"] == payer_id),
             splits[0],
         )
-        payer_split["amount"] += remainder
+        payer_split["amount"] = Decimal(base_cents + remainder_cents).scaleb(-2)
 
     # Sanity check — this must always hold; a failure here is a programming error.
     computed_sum = sum(s["amount"] for s in splits)
@@ -201,11 +349,47 @@ def _compute_equal_splits(
     return splits
 
 
-def _delete_splits(expense: Expense, session: Session) -> None:
-    """Removes all existing splits for an expense. Used before re-creating them on PATCH."""
-    for split in list(expense.splits):
-        session.delete(split)
-    session.flush()
+def _replace_splits(
+        expense: Expense,
+        splits_data: list[dict],
+        session: Session,
+) -> None:
+    """
+    Makes an expense's splits exactly splits_data. Used on PATCH.
+
+    Reconciles instead of deleting and re-inserting every row: one DELETE for
+    users no longer in the split, then one upsert on uq_splits_expense_user
+    that inserts new users and updates an amount only where it changed.
+    Unchanged rows are not rewritten and keep their ids. The executed
+    statements autoflush pending changes first; the stale splits collection
+    is expired so nothing reads it before _reload_for_response().
+
+    The split-sum trigger (migration 002) is deferred to commit, so the
+    intermediate states between the two statements are never checked.
+    """
+    user_ids = [s["user_id"] for s in splits_data]
+    session.execute(
+        delete(Split)
+        .where(Split.expense_id == expense.id, Split.user_id.not_in(user_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+    upsert = pg_insert(Split).values([
+        {
+            "expense_id": expense.id,
+            "user_id": s["user_id"],
+            "amount": s["amount"],
+        }
+        for s in splits_data
+    ])
+    session.execute(
+        upsert.on_conflict_do_update(
+            constraint="uq_splits_expense_user",
+            set_={"amount": upsert.excluded.amount},
+            where=Split.amount != upsert.excluded.amount,
+        )
+    )
+    session.expire(expense, ["splits"])
 
 
 def _create_split_rows(
@@ -213,15 +397,43 @@ def _create_split_rows(
         splits_data: list[dict],
         session: Session,
 ) -> None:
-    """Creates Split rows for an expense from a list of {user_id, amount} dicts."""
-    for s in splits_data:
-        split = Split(
-            expense_id=expense.id,
-            user_id=s["user_id"],
-            amount=s["amount"],
-        )
-        session.add(split)
-    session.flush()
+    """
+    Creates Split rows for an expense from a list of {user_id, amount} dicts.
+
+    One multi-row INSERT with plain dicts: no Split instances are built or
+    tracked, since _reload_for_response() reads the rows back anyway.
+    """
+    if not splits_data:
+        return
+    session.execute(
+        insert(Split),
+        [
+            {
+                "expense_id": expense.id,
+                "user_id": s["user_id"],
+                "amount": s["amount"],
+            }
+            for s in splits_data
+        ],
+    )
+
+
+def _reload_for_response(expense: Expense, session: Session) -> None:
+    """
+    Re-reads a just-written expense in place with _EXPENSE_READ_OPTIONS.
+
+    session.refresh() would reload only the row and leave payer, splits and
+    each split's user to lazy-load one SELECT at a time during
+    serialization. populate_existing overwrites the identity-map instance,
+    so server-set columns (created_at) and the rewritten splits collection
+    are current.
+    """
+    session.get(
+        Expense,
+        expense.id,
+        options=_EXPENSE_READ_OPTIONS,
+        populate_existing=True,
+    )
 
 
 # ── Public service functions ───────────────────────────────────────────────
@@ -264,19 +476,19 @@ def create_expense(
     split_mode: SplitMode = data.get("split_mode", SplitMode.CUSTOM)
     category: Category = data.get("category", Category.OTHER)
 
-    member_ids = _get_member_ids(group_id, session)
+    member_set = _get_member_ids(group_id, session)
 
     # INV-5: paid_by_user_id must be a group member.
-    _validate_payer_is_member(paid_by_user_id, group_id, member_ids)
+    _validate_payer_is_member(paid_by_user_id, group_id, member_set)
 
     # Compute split data before writing the expense row.
     if split_mode == SplitMode.EQUAL:
-        splits_data = _compute_equal_splits(amount, member_ids, paid_by_user_id)
+        splits_data = _compute_equal_splits(amount, sorted(member_set), paid_by_user_id)
     else:
         # custom mode — splits provided by the client (validated by schema).
         raw_splits = data.get("splits") or []
         # INV-6: every split user must be a member.
-        _validate_split_users_are_members(raw_splits, group_id, member_ids)
+        _validate_split_users_are_members(raw_splits, group_id, member_set)
         # INV-1: sum(splits) must equal amount.
         _validate_split_sum(raw_splits, amount, group_id)
         splits_data = raw_splits
@@ -296,8 +508,8 @@ def create_expense(
     # Write split rows.
     _create_split_rows(expense, splits_data, session)
 
-    # Refresh to load relationship so _serialize_expense() in the route works.
-    session.refresh(expense)
+    # Load what _serialize_expense() in the route reads.
+    _reload_for_response(expense, session)
     return expense
 
 
@@ -305,12 +517,17 @@ def list_expenses(
         group_id: int,
         caller_id: int,
         session: Session,
-) -> list[Expense]:
+) -> Iterable[Expense]:
     """
     Returns all active (non-deleted) expenses for a group, newest first.
 
     INV-8: only expenses WHERE deleted_at IS NULL are returned.
     INV-9: caller must be a group member (FORBIDDEN, 403).
+
+    The group and membership checks run immediately; the expenses themselves
+    are streamed in batches of _LIST_BATCH_SIZE as the caller iterates, so a
+    large group is never fully materialized. Iterate while the session is
+    still open.
     """
     _get_group_or_404(group_id, session)
     _require_member(group_id, caller_id, session)
@@ -322,8 +539,18 @@ def list_expenses(
             Expense.deleted_at.is_(None),  # INV-8
         )
         .order_by(Expense.created_at.desc())
+        # _serialize_expense() reads expense.payer.username and, per split,
+        # split.user.username. Load them up front so serializing N expenses
+        # costs a fixed number of queries instead of one per payer/split user.
+        # joinedload for the many-to-one edges; selectinload for the splits
+        # collection so the expense rows are not multiplied by split count.
+        .options(*_EXPENSE_READ_OPTIONS)
     )
-    return list(session.execute(stmt).scalars().all())
+    # No .unique(): the only joined eager load is many-to-one, which cannot
+    # duplicate expense rows, and unique() is incompatible with yield_per.
+    return session.execute(
+        stmt.execution_options(yield_per=_LIST_BATCH_SIZE)
+    ).scalars()
 
 
 def get_expense(
@@ -340,7 +567,7 @@ def get_expense(
     GET on deleted expenses — the deleted_at field is present in the response
     so the client can display the deletion state.
     """
-    expense = _get_expense_or_404(expense_id, session)
+    expense = _get_expense_or_404(expense_id, session, options=_EXPENSE_READ_OPTIONS)
     _require_member(expense.group_id, caller_id, session)
     return expense
 
@@ -371,7 +598,7 @@ def edit_expense(
     Returns:
         The updated Expense ORM object.
     """
-    expense = _get_expense_or_404(expense_id, session)
+    expense = _get_expense_for_write_or_404(expense_id, session)
 
     # INV-9: caller must be a member of the group.
     _require_member(expense.group_id, caller_id, session)
@@ -405,8 +632,8 @@ def edit_expense(
         expense.category = data["category"]
 
     if "paid_by_user_id" in data:
-        member_ids = _get_member_ids(expense.group_id, session)
-        _validate_payer_is_member(data["paid_by_user_id"], expense.group_id, member_ids)
+        member_set = _get_member_ids(expense.group_id, session)
+        _validate_payer_is_member(data["paid_by_user_id"], expense.group_id, member_set)
         expense.paid_by_user_id = data["paid_by_user_id"]
 
     # ── Split and amount updates ───────────────────────────────────────────
@@ -430,27 +657,92 @@ def edit_expense(
         if new_amount is not None:
             expense.amount = new_amount
 
-        member_ids = _get_member_ids(expense.group_id, session)
-        splits_data = _compute_equal_splits(effective_amount, member_ids, expense.paid_by_user_id)
+        member_set = _get_member_ids(expense.group_id, session)
+        splits_data = _compute_equal_splits(
+            effective_amount, sorted(member_set), expense.paid_by_user_id,
+        )
 
-        _delete_splits(expense, session)
-        _create_split_rows(expense, splits_data, session)
+        _replace_splits(expense, splits_data, session)
 
     elif new_amount is not None and new_splits is not None:
         # Custom mode with both amount and splits provided — re-validate INV-1.
-        member_ids = _get_member_ids(expense.group_id, session)
-        _validate_payer_is_member(expense.paid_by_user_id, expense.group_id, member_ids)
-        _validate_split_users_are_members(new_splits, expense.group_id, member_ids)
+        member_set = _get_member_ids(expense.group_id, session)
+        _validate_payer_is_member(expense.paid_by_user_id, expense.group_id, member_set)
+        _validate_split_users_are_members(new_splits, expense.group_id, member_set)
         _validate_split_sum(new_splits, new_amount, expense.group_id)
 
         expense.amount = new_amount
-        _delete_splits(expense, session)
-        _create_split_rows(expense, new_splits, session)
+        _replace_splits(expense, new_splits, session)
 
     # Spec Section 7.2: updated_at is set on every successful PATCH.
     expense.updated_at = datetime.now(timezone.utc)
     session.flush()
-    session.refresh(expense)
+    _reload_for_response(expense, session)
+    return expense
+
+
+def replace_expense(
+        group_id: int,
+        expense_id: int,
+        caller_id: int,
+        data: dict,
+        session: Session,
+) -> Expense:
+    """
+    Overwrites an expense for the legacy PUT /groups/:id/expenses/:id.
+
+    Only the original payer may call it. Every key present in data replaces
+    the stored value; a "splits" key replaces all split rows with one DELETE
+    and one multi-row INSERT. If amount or splits changed, INV-1 is
+    re-checked on the stored rows.
+
+    Args:
+        data: Coerced dict from the route — Decimal amounts, Category and
+              SplitMode enums; only the keys the client sent.
+
+    Raises:
+        AppError(EXPENSE_NOT_FOUND, 404)  — no such expense in this group.
+        AppError(FORBIDDEN, 403)          — caller is not the payer.
+        AppError(SPLIT_SUM_MISMATCH, 422) — INV-1 violated by the new amount
+                                            or splits.
+    """
+    expense = _get_expense_or_404(expense_id, session)
+    if expense.group_id != group_id:
+        raise AppError(
+            ErrorCode.EXPENSE_NOT_FOUND,
+            f"Expense {expense_id} does not exist.",
+            404,
+        )
+
+    if expense.paid_by_user_id != caller_id:
+        raise AppError(
+            ErrorCode.FORBIDDEN,
+            "Only the payer can edit this expense.",
+            403,
+        )
+
+    for field in ("description", "amount", "category", "paid_by_user_id", "split_mode"):
+        if field in data:
+            setattr(expense, field, data[field])
+    expense.updated_at = datetime.now(timezone.utc)
+
+    if "splits" in data:
+        session.execute(
+            delete(Split)
+            .where(Split.expense_id == expense.id)
+            .execution_options(synchronize_session=False)
+        )
+        _create_split_rows(expense, data["splits"], session)
+
+    # INV-1 whenever either side of it changed. trg_splits_sum_check fires
+    # only on writes to splits, so an amount-only PUT would otherwise commit
+    # splits that no longer add up. A mismatch raises and the route's
+    # @transactional rolls back.
+    if "amount" in data or "splits" in data:
+        validate_stored_split_sum(expense.id, expense.amount, session)
+
+    session.flush()
+    _reload_for_response(expense, session)
     return expense
 
 
@@ -472,7 +764,7 @@ def delete_expense(
         AppError(EXPENSE_NOT_FOUND, 404) — expense does not exist.
         AppError(FORBIDDEN, 403)         — caller is not payer or owner.
     """
-    expense = _get_expense_or_404(expense_id, session)
+    expense = _get_expense_for_write_or_404(expense_id, session)
 
     # INV-9: caller must be a member.
     _require_member(expense.group_id, caller_id, session)
@@ -91,11 +91,10 @@ def create_group(name: str, owner_id: int, session: Session) -> dict:
     Returns: dict with group details and initial member list.
     """
     group = Group(name=name, owner_user_id=owner_id)
+    # Attached through the relationship, so one flush inserts the group and
+    # then the owner's membership with group_id already filled in.
+    group.memberships.append(Membership(user_id=owner_id))
     session.add(group)
-    session.flush()  # populate group.id before creating membership
-
-    membership = Membership(user_id=owner_id, group_id=group.id)
-    session.add(membership)
     session.flush()
 
     owner = session.get(User, owner_id)
@@ -133,9 +132,11 @@ def get_group(group_id: int, caller_id: int, session: Session) -> dict:
     Returns full group details including current member list.
 
     INV-9: caller must be a member (FORBIDDEN 403, not 404).
+
+    The member list is needed for the response anyway, so it doubles as the
+    INV-9 check — no separate membership SELECT.
     """
     group = _get_group_or_404(group_id, session)
-    _require_member(group_id, caller_id, session)
 
     stmt = (
         select(User)
@@ -143,7 +144,14 @@ def get_group(group_id: int, caller_id: int, session: Session) -> dict:
         .where(Membership.group_id == group_id)
         .order_by(Membership.joined_at.asc())
     )
-    members = list(session.execute(stmt).scalars().all())
+    members = session.execute(stmt).scalars().all()
+
+    if not any(m.id == caller_id for m in members):
+        raise AppError(
+            ErrorCode.FORBIDDEN,
+            f"You are not a member of group {group_id}.",
+            403,
+        )
 
     return _build_group_dict(group, members)
 
@@ -31,10 +31,11 @@ from __future__ import annotations
 from decimal import Decimal
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from backend.app.errors import AppError, ErrorCode, WarningCode
 from backend.app.models.expense import Expense
+from backend.app.models.group import Group
 from backend.app.models.membership import Membership
 from backend.app.models.settlement import Settlement
 from backend.app.models.split import Split
@@ -170,8 +171,6 @@ def create_settlement(
         An empty warnings list means no warnings.
         Example warning: {"code": "OVERPAYMENT", "message": "..."}
     """
-    from backend.app.models.group import Group  # local import to avoid circular dep
-
     group = session.get(Group, group_id)
     if group is None:
         raise AppError(
@@ -250,8 +249,6 @@ def list_settlements(
 
     INV-9: caller must be a group member (FORBIDDEN, 403).
     """
-    from backend.app.models.group import Group  # local import to avoid circular dep
-
     group = session.get(Group, group_id)
     if group is None:
         raise AppError(
@@ -262,9 +259,13 @@ def list_settlements(
 
     _require_member(group_id, caller_id, session)
 
+    # The route serializes payer and recipient usernames. Both are
+    # many-to-one, so joining them in adds no rows and replaces two lazy
+    # SELECTs per settlement.
     stmt = (
         select(Settlement)
         .where(Settlement.group_id == group_id)
         .order_by(Settlement.created_at.desc())
+        .options(joinedload(Settlement.payer), joinedload(Settlement.recipient))
     )
-    return list(session.execute(stmt).scalars().all())
+    return session.execute(stmt).scalars().all()
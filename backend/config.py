@@ -90,6 +90,25 @@ class BaseConfig:
 
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
 
+    # Connection pool. Requests are short (2–5 small queries), so a warm pool
+    # makes connection acquisition a checkout rather than a new connection.
+    # pool_pre_ping drops connections the server closed while idle;
+    # pool_recycle retires them before typical proxy/server idle timeouts.
+    # READ COMMITTED is the Postgres default; pinning it on the engine avoids
+    # re-applying it per connection.
+    # Views are synchronous: concurrency while a request waits on Postgres
+    # comes from server threads (the dev server is threaded; under a WSGI
+    # server, use threaded workers), one pooled connection per in-flight
+    # request. Size DB_POOL_SIZE + DB_MAX_OVERFLOW to the threads per process.
+    SQLALCHEMY_ENGINE_OPTIONS: dict = {
+        "pool_size":      _parse_int_env("DB_POOL_SIZE", default=10),
+        "max_overflow":   _parse_int_env("DB_MAX_OVERFLOW", default=20),
+        "pool_timeout":   _parse_int_env("DB_POOL_TIMEOUT", default=30),
+        "pool_recycle":   _parse_int_env("DB_POOL_RECYCLE", default=1800),
+        "pool_pre_ping":  True,
+        "isolation_level": "READ COMMITTED",
+    }
+
     JSON_SORT_KEYS: bool = False
     JWT_ACCESS_TOKEN_EXPIRES:  timedelta = timedelta(
         seconds=_access_ttl_seconds()  # default: 15 min
@@ -98,7 +117,10 @@ class BaseConfig:
         seconds=_refresh_ttl_seconds()  # default: 7 days
     )
     JWT_ALGORITHM: str = "HS256"
-    BCRYPT_LOG_ROUNDS: int = 12
+    # Cost is hardware-dependent; pick it per deployment with
+    # backend/utils/bcrypt_cost.py rather than calibrating at startup,
+    # so every process in a deployment hashes at the same cost.
+    BCRYPT_LOG_ROUNDS: int = _parse_int_env("BCRYPT_LOG_ROUNDS", default=12)
 
 
 class DevelopmentConfig(BaseConfig):
@@ -22,11 +22,16 @@ _env_file = Path(__file__).resolve().parent.parent / ".env"
 load_dotenv(_env_file)
 
 # ── Import the app's metadata for autogenerate support ────────────────────
-# Add backend/ to sys.path so `from app.models import ...` works
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Add the project root (parent of backend/) to sys.path so the app is
+# imported as `backend.app...` — the same module names the application and
+# tests use. Importing it as `app.extensions` would create a second, empty
+# `db` whose metadata none of the models register on.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from app.extensions import db  # noqa: E402
+from backend.app import _ensure_models_loaded  # noqa: E402
+from backend.app.extensions import db  # noqa: E402
 
+_ensure_models_loaded()
 target_metadata = db.metadata
 
 # ── Pick the right database URL ───────────────────────────────────────────
@@ -0,0 +1,61 @@
+"""Store refresh token hashes as 32-byte BYTEA instead of 64-char hex text.
+
+Revision: 003_refresh_token_hash_bytea
+Created:  2026-10-16
+
+Why:
+  refresh_tokens.token_hash held sha256(raw).hexdigest() in a VARCHAR(255).
+  Hex doubles the stored size (64 chars for 32 bytes of digest), which
+  doubles the uq_refresh_tokens_hash B-tree that /auth/refresh and
+  /auth/logout probe on every call, and makes every comparison a text
+  comparison. The raw digest in BYTEA is half the size and compares as
+  plain bytes.
+
+Data conversion:
+  decode(token_hash, 'hex') turns each stored hex digest into exactly the
+  bytes hashlib.sha256(raw).digest() now produces, so tokens issued before
+  the migration keep working. The unique constraint is rebuilt in place by
+  ALTER COLUMN ... TYPE.
+
+GUIDE Rule 7 — Append-only:
+  This file must NEVER be edited after it has been applied to any database.
+  If a change is needed, create a new corrective migration.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# ── Alembic revision identifiers ──────────────────────────────────────────
+revision: str = "003_refresh_token_hash_bytea"
+down_revision: str | None = "002_add_split_sum_trigger"
+branch_labels: tuple | None = None
+depends_on: tuple | None = None
+
+
+_TO_BYTEA = """
+ALTER TABLE refresh_tokens
+    ALTER COLUMN token_hash TYPE BYTEA
+    USING decode(token_hash, 'hex');
+"""
+
+_TO_HEX = """
+ALTER TABLE refresh_tokens
+    ALTER COLUMN token_hash TYPE VARCHAR(255)
+    USING encode(token_hash, 'hex');
+"""
+
+
+def upgrade() -> None:
+    """Converts token_hash from hex VARCHAR(255) to the raw 32-byte digest."""
+    op.execute(_TO_BYTEA)
+
+
+def downgrade() -> None:
+    """
+    Converts token_hash back to lowercase hex text.
+
+    encode(..., 'hex') yields the same string hexdigest() did, so tokens
+    remain valid across the downgrade.
+    """
+    op.execute(_TO_HEX)
@@ -0,0 +1,49 @@
+"""Replace the token_hash unique constraint with a covering unique index.
+
+Revision: 004_refresh_token_hash_covering_index
+Created:  2026-10-16
+
+Why:
+  POST /auth/refresh looks a token up by token_hash and then only reads
+  user_id, expires_at and revoked. With a plain UNIQUE(token_hash) index
+  PostgreSQL finds the entry in the index and then fetches the heap page
+  for those three columns. INCLUDE-ing them in the index lets the lookup
+  run as an index-only scan.
+
+  The new index is UNIQUE on token_hash alone (INCLUDE columns do not take
+  part in uniqueness), so it fully replaces uq_refresh_tokens_hash. The old
+  constraint is dropped so the table does not maintain two indexes on the
+  same key.
+
+GUIDE Rule 7 — Append-only:
+  This file must NEVER be edited after it has been applied to any database.
+  If a change is needed, create a new corrective migration.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# ── Alembic revision identifiers ──────────────────────────────────────────
+revision: str = "004_refresh_token_hash_covering_index"
+down_revision: str | None = "003_refresh_token_hash_bytea"
+branch_labels: tuple | None = None
+depends_on: tuple | None = None
+
+
+def upgrade() -> None:
+    """Creates idx_refresh_tokens_hash_covering, then drops the old constraint."""
+    op.create_index(
+        "idx_refresh_tokens_hash_covering",
+        "refresh_tokens",
+        ["token_hash"],
+        unique=True,
+        postgresql_include=["user_id", "expires_at", "revoked"],
+    )
+    op.drop_constraint("uq_refresh_tokens_hash", "refresh_tokens", type_="unique")
+
+
+def downgrade() -> None:
+    """Restores UNIQUE(token_hash) before dropping the covering index."""
+    op.create_unique_constraint("uq_refresh_tokens_hash", "refresh_tokens", ["token_hash"])
+    op.drop_index("idx_refresh_tokens_hash_covering", table_name="refresh_tokens")
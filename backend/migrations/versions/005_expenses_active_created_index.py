@@ -0,0 +1,53 @@
+"""Extend the active-expenses partial index with created_at DESC.
+
+Revision: 005_expenses_active_created_index
+Created:  2026-10-16
+
+Why:
+  idx_expenses_active (001) already restricts the index to deleted_at IS NULL
+  rows, but only on group_id. GET /groups/:id/expenses also orders by
+  created_at DESC, so PostgreSQL still sorts the group's active rows after
+  the index scan. Keying the partial index on (group_id, created_at DESC)
+  returns the rows already in listing order.
+
+  The balance queries filter on group_id alone; the leading column still
+  serves them, so the old single-column partial index is dropped rather
+  than kept alongside.
+
+GUIDE Rule 7 — Append-only:
+  This file must NEVER be edited after it has been applied to any database.
+  If a change is needed, create a new corrective migration.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# ── Alembic revision identifiers ──────────────────────────────────────────
+revision: str = "005_expenses_active_created_index"
+down_revision: str | None = "004_refresh_token_hash_covering_index"
+branch_labels: tuple | None = None
+depends_on: tuple | None = None
+
+
+def upgrade() -> None:
+    """Creates idx_expenses_active_created, then drops idx_expenses_active."""
+    op.create_index(
+        "idx_expenses_active_created",
+        "expenses",
+        ["group_id", sa.text("created_at DESC")],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.drop_index("idx_expenses_active", table_name="expenses")
+
+
+def downgrade() -> None:
+    """Restores the single-column partial index from 001."""
+    op.create_index(
+        "idx_expenses_active",
+        "expenses",
+        ["group_id"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.drop_index("idx_expenses_active_created", table_name="expenses")
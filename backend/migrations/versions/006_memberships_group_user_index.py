@@ -0,0 +1,53 @@
+"""Widen the memberships group_id index to (group_id, user_id).
+
+Revision: 006_memberships_group_user_index
+Created:  2026-10-16
+
+Why:
+  Every membership read filters on group_id and returns only user_id: the
+  INV-9 checks, the expense service's group + member load, and the ledger
+  CTE's zero-fill rows. idx_memberships_group (001) holds only group_id, so
+  each match still visits the heap for user_id. Keying the index on
+  (group_id, user_id) makes these index-only scans. Heap fetches drop to
+  zero once autovacuum has marked the pages all-visible.
+
+  Lookups by user (list_groups) are already served by the unique
+  (user_id, group_id) constraint, so no second index is added.
+
+  The old single-column index is a prefix of the new one and is dropped
+  rather than kept alongside.
+
+GUIDE Rule 7 — Append-only:
+  This file must NEVER be edited after it has been applied to any database.
+  If a change is needed, create a new corrective migration.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# ── Alembic revision identifiers ──────────────────────────────────────────
+revision: str = "006_memberships_group_user_index"
+down_revision: str | None = "005_expenses_active_created_index"
+branch_labels: tuple | None = None
+depends_on: tuple | None = None
+
+
+def upgrade() -> None:
+    """Creates idx_memberships_group_user, then drops idx_memberships_group."""
+    op.create_index(
+        "idx_memberships_group_user",
+        "memberships",
+        ["group_id", "user_id"],
+    )
+    op.drop_index("idx_memberships_group", table_name="memberships")
+
+
+def downgrade() -> None:
+    """Restores the single-column index from 001."""
+    op.create_index(
+        "idx_memberships_group",
+        "memberships",
+        ["group_id"],
+    )
+    op.drop_index("idx_memberships_group_user", table_name="memberships")
@@ -260,6 +260,20 @@ class TestMe:
         assert resp.status_code == 401
         assert resp.get_json()["error"]["code"] == "TOKEN_INVALID"
 
+    def test_me_accepts_any_whitespace_after_bearer(self, client):
+        """The scheme may be followed by a tab or several spaces, as with split()."""
+        token = register(client, "alice")["access_token"]
+        for header in (f"Bearer\t{token}", f"bearer   {token}"):
+            resp = client.get("/api/v1/auth/me", headers={"Authorization": header})
+            assert resp.status_code == 200
+
+    def test_preflight_options_skips_auth(self, client):
+        """CORS preflight carries no Authorization header and must not get 401."""
+        resp = client.options("/api/v1/auth/me", headers={"Origin": "http://localhost:8000"})
+        assert resp.status_code == 200
+        assert "GET" in resp.headers["Allow"]
+        assert resp.headers["Access-Control-Allow-Origin"] == "http://localhost:8000"
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Error envelope format
@@ -19,7 +19,8 @@ Properties verified:
   - Category-filtered response intentionally does NOT produce sum=="0.00"
 
 ARCHITECTURE.md Section 6: balance computation is the SINGLE SOURCE OF TRUTH.
-The canonical formula is implemented in balance_service.compute_balances().
+The canonical formula is the ledger CTE summed by
+balance_service.get_member_balances(); these tests check its numbers end to end.
 """
 
 from __future__ import annotations
@@ -349,3 +350,45 @@ class TestBalanceResponseStructure:
         assert isinstance(data["balance_sum"], str)
         for entry in data["balances"]:
             assert isinstance(entry["balance"], str)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Category-scoped view
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestCategoryFilteredBalances:
+
+    def test_category_filter_excludes_other_categories_and_settlements(self, client):
+        """Only FOOD expenses count; settlements are cross-category and left out."""
+        alice, bob, group = _setup(client)
+        carol = register(client, "carol")
+        add_member(client, alice["access_token"], group["id"], carol["user"]["id"])
+
+        _create_50_50_expense(client, alice, bob, group, "100.00")
+        make_expense(
+            client, bob["access_token"], group["id"],
+            paid_by_user_id=bob["user"]["id"],
+            amount="45.00",
+            category="food",
+            splits=[
+                {"user_id": alice["user"]["id"], "amount": "15.00"},
+                {"user_id": bob["user"]["id"],   "amount": "15.00"},
+                {"user_id": carol["user"]["id"], "amount": "15.00"},
+            ],
+        )
+        client.post(
+            f"/api/v1/groups/{group['id']}/settlements",
+            json={"paid_to_user_id": alice["user"]["id"], "amount": "20.00"},
+            headers=auth_headers(bob["access_token"]),
+        )
+
+        resp = _get_balances(client, alice["access_token"], group["id"], "food")
+        assert resp.status_code == 200
+        data = resp.get_json()["data"]
+        balances = {b["user_id"]: Decimal(b["balance"]) for b in data["balances"]}
+        assert balances == {
+            alice["user"]["id"]: Decimal("-15.00"),
+            bob["user"]["id"]:   Decimal("30.00"),
+            carol["user"]["id"]: Decimal("-15.00"),
+        }
+        assert data["simplified_debts"] == []
@@ -287,3 +287,113 @@ class TestPatchFailurePaths:
         resp = client.patch(f"/api/v1/expenses/{eid}", json={"description": "Anon"})
         assert resp.status_code == 401
         assert resp.get_json()["error"]["code"] == "TOKEN_MISSING"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Legacy PUT /groups/:gid/expenses/:id
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestLegacyPut:
+
+    def test_put_split_sum_mismatch_returns_422_and_keeps_old_splits(self, client):
+        """INV-1 is summed in SQL after the re-split; a mismatch rolls back."""
+        alice, bob, group, eid = _two_member_group_with_expense(client)
+
+        resp = client.put(
+            f"/api/v1/groups/{group['id']}/expenses/{eid}",
+            json={
+                "splits": [
+                    {"user_id": alice["user"]["id"], "amount": "60.00"},
+                    {"user_id": bob["user"]["id"],   "amount": "30.00"},
+                ],
+            },
+            headers=auth_headers(alice["access_token"]),
+        )
+        assert resp.status_code == 422
+        assert resp.get_json()["error"]["code"] == "SPLIT_SUM_MISMATCH"
+
+        splits = client.get(
+            f"/api/v1/expenses/{eid}", headers=auth_headers(alice["access_token"]),
+        ).get_json()["data"]["splits"]
+        assert sum(Decimal(s["amount"]) for s in splits) == Decimal("100.00")
+
+    def test_put_amount_only_mismatch_returns_422_and_keeps_old_amount(self, client):
+        """INV-1 is re-checked when only the amount changes; the splits stay."""
+        alice, bob, group, eid = _two_member_group_with_expense(client)
+
+        resp = client.put(
+            f"/api/v1/groups/{group['id']}/expenses/{eid}",
+            json={"amount": "500.00"},
+            headers=auth_headers(alice["access_token"]),
+        )
+        assert resp.status_code == 422
+        assert resp.get_json()["error"]["code"] == "SPLIT_SUM_MISMATCH"
+
+        body = client.get(
+            f"/api/v1/expenses/{eid}", headers=auth_headers(alice["access_token"]),
+        ).get_json()["data"]
+        assert body["amount"] == "100.00"
+        assert sum(Decimal(s["amount"]) for s in body["splits"]) == Decimal("100.00")
+
+    def test_put_sets_updated_at_in_response(self, client):
+        alice, bob, group, eid = _two_member_group_with_expense(client)
+
+        resp = client.put(
+            f"/api/v1/groups/{group['id']}/expenses/{eid}",
+            json={"description": "Renamed"},
+            headers=auth_headers(alice["access_token"]),
+        )
+        assert resp.status_code == 200
+        assert resp.get_json()["warnings"] == []
+        body = resp.get_json()["data"]
+        assert body["description"] == "Renamed"
+        assert body["updated_at"] is not None
+
+    def test_put_category_split_mode_and_payer_are_coerced_and_reloaded(self, client):
+        """Enum fields are coerced and the response shows the new payer."""
+        alice, bob, group, eid = _two_member_group_with_expense(client)
+
+        resp = client.put(
+            f"/api/v1/groups/{group['id']}/expenses/{eid}",
+            json={
+                "category": "food",
+                "split_mode": "custom",
+                "paid_by_user_id": bob["user"]["id"],
+                "amount": "90.00",
+                "splits": [
+                    {"user_id": alice["user"]["id"], "amount": "45.00"},
+                    {"user_id": bob["user"]["id"],   "amount": "45.00"},
+                ],
+            },
+            headers=auth_headers(alice["access_token"]),
+        )
+        assert resp.status_code == 200
+        body = resp.get_json()["data"]
+        assert body["category"] == "food"
+        assert body["split_mode"] == "custom"
+        assert body["amount"] == "90.00"
+        assert body["paid_by_user_id"] == bob["user"]["id"]
+        assert body["paid_by_username"] == bob["user"]["username"]
+        assert sorted(s["amount"] for s in body["splits"]) == ["45.00", "45.00"]
+
+    def test_put_invalid_category_returns_400(self, client):
+        alice, bob, group, eid = _two_member_group_with_expense(client)
+
+        resp = client.put(
+            f"/api/v1/groups/{group['id']}/expenses/{eid}",
+            json={"category": "not-a-category"},
+            headers=auth_headers(alice["access_token"]),
+        )
+        assert resp.status_code == 400
+        assert resp.get_json()["error"]["code"] == "INVALID_CATEGORY"
+
+    def test_put_by_non_payer_returns_403_envelope(self, client):
+        alice, bob, group, eid = _two_member_group_with_expense(client)
+
+        resp = client.put(
+            f"/api/v1/groups/{group['id']}/expenses/{eid}",
+            json={"description": "Hijacked"},
+            headers=auth_headers(bob["access_token"]),
+        )
+        assert resp.status_code == 403
+        assert resp.get_json()["error"]["code"] == "FORBIDDEN"
@@ -0,0 +1,34 @@
+"""
+tests/integration/test_users.py — Integration tests for GET /users/by-username/:username.
+"""
+
+from __future__ import annotations
+
+from .conftest import auth_headers, register
+
+
+class TestGetUserByUsername:
+
+    def test_lookup_returns_profile_with_private_cache_header(self, client):
+        alice = register(client, "alice")
+        register(client, "bob")
+
+        resp = client.get(
+            "/api/v1/users/by-username/bob",
+            headers=auth_headers(alice["access_token"]),
+        )
+        assert resp.status_code == 200
+        assert resp.get_json()["data"]["username"] == "bob"
+        assert "private" in resp.headers["Cache-Control"]
+        assert resp.cache_control.max_age == 30
+
+    def test_unknown_username_returns_404_uncached(self, client):
+        alice = register(client, "alice")
+
+        resp = client.get(
+            "/api/v1/users/by-username/nobody",
+            headers=auth_headers(alice["access_token"]),
+        )
+        assert resp.status_code == 404
+        assert resp.get_json()["error"]["code"] == "USER_NOT_FOUND"
+        assert resp.cache_control.max_age is None
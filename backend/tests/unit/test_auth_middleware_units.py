@@ -0,0 +1,147 @@
+"""
+Unit tests for the HS256 fast-path token verifier in auth_middleware.
+
+_decode_hs256 must accept exactly what jwt.decode(..., algorithms=["HS256"])
+accepts and raise the same jwt exception classes, so the middleware's
+TOKEN_EXPIRED / TOKEN_INVALID mapping is unchanged. _decode_hs256_cached
+must behave identically while verifying each token only once.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from backend.app.middleware import auth_middleware
+from backend.app.middleware.auth_middleware import _decode_hs256, _decode_hs256_cached
+
+SECRET = "unit-test-secret"
+
+
+def _token(exp_delta: timedelta = timedelta(minutes=5), **overrides) -> str:
+    now = datetime.now(timezone.utc)
+    payload = {"sub": "7", "iat": now, "exp": now + exp_delta, **overrides}
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+def _outcome(decode, token):
+    """The payload on success, else the exception class raised."""
+    try:
+        return decode(token)
+    except jwt.InvalidTokenError as exc:
+        return type(exc)
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {},
+        {"exp": timedelta(seconds=-1)},
+        {"iat": timedelta(minutes=10)},
+        {"nbf": timedelta(minutes=10)},
+        {"nbf": timedelta(minutes=-10)},
+        {"aud": "someone-else"},
+        {"aud": ""},
+        {"iss": "anyone", "jti": "abc"},
+    ],
+    ids=[
+        "valid", "expired", "future_iat", "future_nbf", "past_nbf",
+        "aud", "empty_aud", "unchecked_iss_jti",
+    ],
+)
+def test_claim_checks_match_pyjwt(claims):
+    """Same payload or same exception class as jwt.decode(), claim by claim."""
+    now = datetime.now(timezone.utc)
+    token = _token(**{
+        k: now + v if isinstance(v, timedelta) else v for k, v in claims.items()
+    })
+    expected = _outcome(lambda t: jwt.decode(t, SECRET, algorithms=["HS256"]), token)
+
+    assert _outcome(lambda t: _decode_hs256(t, SECRET), token) == expected
+
+
+def test_expired_token_raises_expired_signature_error():
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _decode_hs256(_token(exp_delta=timedelta(seconds=-1)), SECRET)
+
+
+def test_future_iat_raises_immature_signature_error():
+    with pytest.raises(jwt.ImmatureSignatureError):
+        _decode_hs256(_token(iat=datetime.now(timezone.utc) + timedelta(minutes=10)), SECRET)
+
+
+def test_aud_claim_raises_invalid_audience_error():
+    with pytest.raises(jwt.InvalidAudienceError):
+        _decode_hs256(_token(aud="someone-else"), SECRET)
+
+
+def test_wrong_secret_raises_invalid_signature_error():
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_hs256(_token(), "some-other-secret")
+
+
+def test_tampered_payload_is_rejected():
+    header, _, signature = _token().split(".")
+    forged_payload = _token(sub="1").split(".")[1]
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_hs256(f"{header}.{forged_payload}.{signature}", SECRET)
+
+
+def test_non_hs256_header_is_rejected():
+    token = jwt.encode({"sub": "7"}, None, algorithm="none")
+
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        _decode_hs256(token, SECRET)
+
+
+@pytest.mark.parametrize("raw_token", ["", "abc", "a.b", "a.b.c.d", "not.valid.base64!"])
+def test_malformed_token_raises_invalid_token_error(raw_token):
+    with pytest.raises(jwt.InvalidTokenError):
+        _decode_hs256(raw_token, SECRET)
+
+
+@pytest.fixture
+def empty_verify_cache():
+    auth_middleware._verified_hs256_payload.cache_clear()
+    yield
+    auth_middleware._verified_hs256_payload.cache_clear()
+
+
+def test_cached_decode_verifies_each_token_once(empty_verify_cache, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        auth_middleware,
+        "_decode_hs256",
+        lambda token, secret: calls.append(token) or _decode_hs256(token, secret),
+    )
+    token = _token()
+
+    first = _decode_hs256_cached(token, SECRET)
+    second = _decode_hs256_cached(token, SECRET)
+
+    assert first == second == jwt.decode(token, SECRET, algorithms=["HS256"])
+    assert calls == [token]
+
+
+def test_cached_decode_rejects_token_once_it_expires(empty_verify_cache, monkeypatch):
+    token = _token(exp_delta=timedelta(seconds=60))
+    _decode_hs256_cached(token, SECRET)
+
+    later = time.time() + 120
+    monkeypatch.setattr(auth_middleware.time, "time", lambda: later)
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _decode_hs256_cached(token, SECRET)
+
+
+def test_cached_decode_does_not_cache_failures(empty_verify_cache):
+    token = _token()
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_hs256_cached(token, "some-other-secret")
+
+    assert _decode_hs256_cached(token, SECRET)["sub"] == "7"
@@ -4,6 +4,7 @@ Unit tests for auth_service branches not naturally hit in integration flow.
 
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -44,3 +45,67 @@ def test_get_current_user_raises_user_not_found():
     err = exc_info.value
     assert err.code == ErrorCode.USER_NOT_FOUND
     assert err.http_status == 404
+
+
+def test_hash_token_returns_raw_sha256_digest():
+    digest = auth_service._hash_token("raw-refresh-token")
+
+    assert isinstance(digest, bytes)
+    assert len(digest) == 32
+    # Same bytes migration 003 derives from previously stored hex digests.
+    assert digest == bytes.fromhex(hashlib.sha256(b"raw-refresh-token").hexdigest())
+
+
+def test_logout_revokes_with_a_single_conditional_update():
+    session = MagicMock()
+    session.execute.return_value.scalar_one_or_none.return_value = 12
+
+    auth_service.logout_user("raw-refresh-token", session=session)
+
+    assert session.execute.call_count == 1
+    sql = str(session.execute.call_args.args[0])
+    assert sql.startswith("UPDATE refresh_tokens SET revoked=")
+    assert "refresh_tokens.revoked IS " in sql
+    assert "RETURNING refresh_tokens.id" in sql
+    session.flush.assert_not_called()
+
+
+def test_logout_raises_when_no_unrevoked_token_matches():
+    session = MagicMock()
+    session.execute.return_value.scalar_one_or_none.return_value = None
+
+    with pytest.raises(AppError) as exc_info:
+        auth_service.logout_user("raw-refresh-token", session=session)
+
+    assert exc_info.value.code == ErrorCode.REFRESH_TOKEN_INVALID
+    assert exc_info.value.http_status == 401
+
+
+@pytest.mark.parametrize(
+    ("rows", "expected_code", "expected_field"),
+    [
+        ([SimpleNamespace(email="a@x.io", username="other")], ErrorCode.DUPLICATE_EMAIL, "email"),
+        ([SimpleNamespace(email="b@x.io", username="alice")], ErrorCode.DUPLICATE_USERNAME, "username"),
+        (
+            [
+                SimpleNamespace(email="b@x.io", username="alice"),
+                SimpleNamespace(email="a@x.io", username="other"),
+            ],
+            ErrorCode.DUPLICATE_EMAIL,
+            "email",
+        ),
+    ],
+)
+def test_register_checks_both_unique_columns_in_one_query(rows, expected_code, expected_field):
+    session = MagicMock()
+    session.execute.return_value.all.return_value = rows
+
+    with pytest.raises(AppError) as exc_info:
+        auth_service.register_user("alice", "a@x.io", "Passw0rd!", session=session)
+
+    assert session.execute.call_count == 1
+    sql = str(session.execute.call_args.args[0])
+    assert "users.email = " in sql and " OR users.username = " in sql
+    assert exc_info.value.code == expected_code
+    assert exc_info.value.field == expected_field
+    session.add.assert_not_called()
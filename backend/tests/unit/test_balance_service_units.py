@@ -1,5 +1,5 @@
 """
-Unit tests for balance_service data-access helpers and get_balance_response.
+Unit tests for balance_service.get_member_balances and get_balance_response.
 
 These tests intentionally avoid Flask and real DB access. Every DB interaction is
 mocked through a fake SQLAlchemy session object.
@@ -18,89 +18,73 @@ from backend.app.models.expense import Category
 from backend.app.services import balance_service
 
 
-def _mock_scalars_all(session: MagicMock, rows: list) -> None:
-    session.execute.return_value.scalars.return_value.all.return_value = rows
-
-
-def test_get_active_expenses_applies_deleted_filter_and_optional_category():
+@patch("backend.app.services.balance_service.get_member_balances", return_value=None)
+def test_get_balance_response_raises_group_not_found(mock_member_balances):
     session = MagicMock()
-    rows = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
-    _mock_scalars_all(session, rows)
-
-    result = balance_service.get_active_expenses(
-        group_id=10,
-        session=session,
-        category=Category.FOOD,
-    )
 
-    assert result == rows
-    session.execute.assert_called_once()
+    with pytest.raises(AppError) as exc_info:
+        balance_service.get_balance_response(group_id=999, caller_id=1, session=session)
 
+    err = exc_info.value
+    assert err.code == ErrorCode.GROUP_NOT_FOUND
+    assert err.http_status == 404
 
-def test_get_splits_for_active_expenses_applies_optional_category():
-    session = MagicMock()
-    rows = [SimpleNamespace(id=11), SimpleNamespace(id=12)]
-    _mock_scalars_all(session, rows)
 
-    result = balance_service.get_splits_for_active_expenses(
-        group_id=7,
-        session=session,
-        category=Category.TRANSPORT,
+def _balance_row(user_id: int, username: str, balance: str, is_member: bool = True):
+    return SimpleNamespace(
+        user_id=user_id,
+        username=username,
+        is_member=is_member,
+        balance=Decimal(balance),
     )
 
-    assert result == rows
-    session.execute.assert_called_once()
-
 
-def test_get_settlements_returns_all_rows():
+def test_get_member_balances_joins_users_onto_ledger_in_one_query():
     session = MagicMock()
-    rows = [SimpleNamespace(id=101)]
-    _mock_scalars_all(session, rows)
+    session.execute.return_value.all.return_value = []
 
-    result = balance_service.get_settlements(group_id=3, session=session)
+    balance_service.get_member_balances(group_id=1, session=session)
 
-    assert result == rows
     session.execute.assert_called_once()
+    sql = str(session.execute.call_args.args[0])
+    assert sql.startswith("WITH ledger AS")
+    assert "JOIN users ON users.id = ledger.user_id" in sql
+    assert "bool_or(ledger.is_member)" in sql
+    assert "FROM groups LEFT OUTER JOIN (SELECT" in sql
+    assert sql.count("UNION ALL") == 4
+    assert "expenses.deleted_at IS NULL" in sql  # INV-8
 
 
-def test_get_member_ids_returns_scalars():
+def test_get_member_balances_category_filter_excludes_settlements():
     session = MagicMock()
-    member_ids = [1, 2, 5]
-    _mock_scalars_all(session, member_ids)
+    session.execute.return_value.all.return_value = []
 
-    result = balance_service.get_member_ids(group_id=9, session=session)
+    balance_service.get_member_balances(group_id=1, session=session, category=Category.FOOD)
 
-    assert result == member_ids
-    session.execute.assert_called_once()
+    sql = str(session.execute.call_args.args[0])
+    assert "settlements" not in sql
+    assert "expenses.category" in sql
 
 
-def test_get_members_returns_user_rows():
+def test_get_member_balances_distinguishes_missing_group_from_empty_one():
     session = MagicMock()
-    members = [SimpleNamespace(id=1, username="alice"), SimpleNamespace(id=2, username="bob")]
-    _mock_scalars_all(session, members)
 
-    result = balance_service.get_members(group_id=9, session=session)
+    session.execute.return_value.all.return_value = []
+    assert balance_service.get_member_balances(group_id=1, session=session) is None
 
-    assert result == members
-    session.execute.assert_called_once()
+    session.execute.return_value.all.return_value = [_balance_row(None, None, "0.00")]
+    assert balance_service.get_member_balances(group_id=1, session=session) == []
 
 
-def test_get_balance_response_raises_group_not_found():
+@patch("backend.app.services.balance_service.get_member_balances")
+def test_get_balance_response_raises_forbidden_for_non_member(mock_member_balances):
     session = MagicMock()
-    session.get.return_value = None
-
-    with pytest.raises(AppError) as exc_info:
-        balance_service.get_balance_response(group_id=999, caller_id=1, session=session)
-
-    err = exc_info.value
-    assert err.code == ErrorCode.GROUP_NOT_FOUND
-    assert err.http_status == 404
-
-
-@patch("backend.app.services.balance_service.get_member_ids", return_value=[2, 3])
-def test_get_balance_response_raises_forbidden_for_non_member(mock_member_ids):
-    session = MagicMock()
-    session.get.return_value = SimpleNamespace(id=42)
+    mock_member_balances.return_value = [
+        _balance_row(2, "bob", "0.00"),
+        _balance_row(3, "carol", "0.00"),
+        # A former member has ledger rows but is_member is false.
+        _balance_row(1, "alice", "0.00", is_member=False),
+    ]
 
     with pytest.raises(AppError) as exc_info:
         balance_service.get_balance_response(group_id=42, caller_id=1, session=session)
@@ -108,29 +92,20 @@ def test_get_balance_response_raises_forbidden_for_non_member(mock_member_ids):
     err = exc_info.value
     assert err.code == ErrorCode.FORBIDDEN
     assert err.http_status == 403
-    mock_member_ids.assert_called_once()
+    mock_member_balances.assert_called_once()
 
 
 @patch("backend.app.services.balance_service.simplify_debts")
-@patch("backend.app.services.balance_service.get_members")
-@patch("backend.app.services.balance_service.compute_balances")
-@patch("backend.app.services.balance_service.get_member_ids", return_value=[1, 2])
+@patch("backend.app.services.balance_service.get_member_balances")
 def test_get_balance_response_unfiltered_happy_path(
-    mock_member_ids,
-    mock_compute_balances,
-    mock_get_members,
+    mock_member_balances,
     mock_simplify_debts,
 ):
     session = MagicMock()
-    session.get.return_value = SimpleNamespace(id=1)
-
-    mock_compute_balances.return_value = {
-        1: Decimal("10.00"),
-        2: Decimal("-10.00"),
-    }
-    mock_get_members.return_value = [
-        SimpleNamespace(id=1, username="alice"),
-        SimpleNamespace(id=2, username="bob"),
+
+    mock_member_balances.return_value = [
+        _balance_row(1, "alice", "10.00"),
+        _balance_row(2, "bob", "-10.00"),
     ]
     mock_simplify_debts.return_value = [
         {"from_user_id": 2, "to_user_id": 1, "amount": Decimal("10.00")}
@@ -154,30 +129,32 @@ def test_get_balance_response_unfiltered_happy_path(
         }
     ]
 
-    mock_member_ids.assert_called_once()
-    mock_compute_balances.assert_called_once()
-    mock_get_members.assert_called_once()
+    mock_member_balances.assert_called_once_with(1, session, None)
     mock_simplify_debts.assert_called_once()
 
 
-@patch("backend.app.services.balance_service.get_members")
-@patch("backend.app.services.balance_service.compute_balances")
-@patch("backend.app.services.balance_service.get_member_ids", return_value=[1, 2])
+@patch("backend.app.services.balance_service.get_member_balances")
+def test_get_balance_response_names_former_members_by_id(mock_member_balances):
+    session = MagicMock()
+    mock_member_balances.return_value = [
+        _balance_row(1, "alice", "5.00"),
+        _balance_row(9, "zed", "-5.00", is_member=False),
+    ]
+
+    payload = balance_service.get_balance_response(group_id=1, caller_id=1, session=session)
+
+    assert payload["balances"][1] == {"user_id": 9, "name": "user_9", "balance": "-5.00"}
+
+
+@patch("backend.app.services.balance_service.get_member_balances")
 def test_get_balance_response_unfiltered_raises_internal_error_on_nonzero_sum(
-    mock_member_ids,
-    mock_compute_balances,
-    mock_get_members,
+    mock_member_balances,
 ):
     session = MagicMock()
-    session.get.return_value = SimpleNamespace(id=1)
-
-    mock_compute_balances.return_value = {
-        1: Decimal("10.00"),
-        2: Decimal("-9.99"),
-    }
-    mock_get_members.return_value = [
-        SimpleNamespace(id=1, username="alice"),
-        SimpleNamespace(id=2, username="bob"),
+
+    mock_member_balances.return_value = [
+        _balance_row(1, "alice", "10.00"),
+        _balance_row(2, "bob", "-9.99"),
     ]
 
     with pytest.raises(AppError) as exc_info:
@@ -187,31 +164,20 @@ def test_get_balance_response_unfiltered_raises_internal_error_on_nonzero_sum(
     assert err.code == ErrorCode.INTERNAL_ERROR
     assert err.http_status == 500
 
-    mock_member_ids.assert_called_once()
-    mock_compute_balances.assert_called_once()
-    mock_get_members.assert_called_once()
+    mock_member_balances.assert_called_once()
 
 
 @patch("backend.app.services.balance_service.simplify_debts")
-@patch("backend.app.services.balance_service.get_members")
-@patch("backend.app.services.balance_service.compute_balances")
-@patch("backend.app.services.balance_service.get_member_ids", return_value=[1, 2])
+@patch("backend.app.services.balance_service.get_member_balances")
 def test_get_balance_response_category_filtered_skips_simplification(
-    mock_member_ids,
-    mock_compute_balances,
-    mock_get_members,
+    mock_member_balances,
     mock_simplify_debts,
 ):
     session = MagicMock()
-    session.get.return_value = SimpleNamespace(id=1)
-
-    mock_compute_balances.return_value = {
-        1: Decimal("7.00"),
-        2: Decimal("-3.00"),
-    }
-    mock_get_members.return_value = [
-        SimpleNamespace(id=1, username="alice"),
-        SimpleNamespace(id=2, username="bob"),
+
+    mock_member_balances.return_value = [
+        _balance_row(1, "alice", "7.00"),
+        _balance_row(2, "bob", "-3.00"),
     ]
 
     payload = balance_service.get_balance_response(
@@ -224,6 +190,4 @@ def test_get_balance_response_category_filtered_skips_simplification(
     assert payload["simplified_debts"] == []
     assert payload["balance_sum"] == "4.00"
     mock_simplify_debts.assert_not_called()
-    mock_member_ids.assert_called_once()
-    mock_compute_balances.assert_called_once()
-    mock_get_members.assert_called_once()
+    mock_member_balances.assert_called_once_with(1, session, Category.FOOD)
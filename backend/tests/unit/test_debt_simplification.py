@@ -295,3 +295,27 @@ def test_result_structure_has_required_keys():
         assert "from_user_id" in txn
         assert "to_user_id"   in txn
         assert "amount"       in txn
+
+
+def test_residual_is_rematched_against_current_largest_side():
+    """
+    After a partial transfer, the leftover creditor is re-ranked: the next
+    transfer goes to whichever creditor is now largest, not the one that
+    happened to be first in the original ordering.
+    """
+    balances = {
+        1: Decimal("100.00"),
+        2: Decimal("60.00"),
+        3: Decimal("-90.00"),
+        4: Decimal("-70.00"),
+    }
+    assert _sum_balances(balances) == Decimal("0.00")
+
+    result = simplify_debts(balances)
+
+    assert [(t["from_user_id"], t["to_user_id"], t["amount"]) for t in result] == [
+        (3, 1, Decimal("90.00")),
+        (4, 2, Decimal("60.00")),
+        (4, 1, Decimal("10.00")),
+    ]
+    _verify_correctness(balances, result)
@@ -12,20 +12,31 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from backend.app.errors import AppError, ErrorCode
 from backend.app.models.expense import Category, SplitMode
 from backend.app.services import expense_service
 
 
-def _mock_scalars_all(session: MagicMock, rows: list) -> None:
-    session.execute.return_value.scalars.return_value.all.return_value = rows
+def _mock_group_row(session: MagicMock, group, member_ids: list) -> None:
+    session.execute.return_value.one_or_none.return_value = (group, member_ids)
+
+
+def _assert_reloaded_for_response(session: MagicMock, expense) -> None:
+    session.get.assert_called_once()
+    assert session.get.call_args.args[1] == expense.id
+    assert session.get.call_args.kwargs == {
+        "options": expense_service._EXPENSE_READ_OPTIONS,
+        "populate_existing": True,
+    }
 
 
 def test_get_group_or_404_returns_group_when_present():
     session = MagicMock()
+    session.info = {}
     group = SimpleNamespace(id=1, owner_user_id=1)
-    session.get.return_value = group
+    _mock_group_row(session, group, [1])
 
     result = expense_service._get_group_or_404(group_id=1, session=session)
 
@@ -34,7 +45,8 @@ def test_get_group_or_404_returns_group_when_present():
 
 def test_get_group_or_404_raises_when_missing():
     session = MagicMock()
-    session.get.return_value = None
+    session.info = {}
+    session.execute.return_value.one_or_none.return_value = None
 
     with pytest.raises(AppError) as exc_info:
         expense_service._get_group_or_404(group_id=404, session=session)
@@ -44,6 +56,27 @@ def test_get_group_or_404_raises_when_missing():
     assert err.http_status == 404
 
 
+def test_group_and_members_load_in_one_aggregated_query():
+    session = MagicMock()
+    session.info = {}
+    _mock_group_row(session, SimpleNamespace(id=3), [4, 5])
+
+    expense_service._get_group_or_404(group_id=3, session=session)
+
+    session.execute.assert_called_once()
+    sql = str(session.execute.call_args.args[0])
+    assert "array_agg(memberships.user_id)" in sql
+    assert "FROM groups LEFT OUTER JOIN memberships" in sql
+
+
+def test_group_without_memberships_has_no_member_ids():
+    session = MagicMock()
+    session.info = {}
+    _mock_group_row(session, SimpleNamespace(id=3), [None])
+
+    assert expense_service._get_member_ids(group_id=3, session=session) == frozenset()
+
+
 def test_get_expense_or_404_returns_expense_when_present():
     session = MagicMock()
     expense = SimpleNamespace(id=10, group_id=1)
@@ -54,6 +87,16 @@ def test_get_expense_or_404_returns_expense_when_present():
     assert result is expense
 
 
+def test_get_expense_or_404_forwards_loader_options():
+    session = MagicMock()
+    session.get.return_value = SimpleNamespace(id=10, group_id=1)
+    options = expense_service._EXPENSE_READ_OPTIONS
+
+    expense_service._get_expense_or_404(expense_id=10, session=session, options=options)
+
+    assert session.get.call_args.kwargs["options"] is options
+
+
 def test_get_expense_or_404_raises_when_missing():
     session = MagicMock()
     session.get.return_value = None
@@ -66,9 +109,41 @@ def test_get_expense_or_404_raises_when_missing():
     assert err.http_status == 404
 
 
+def test_get_expense_for_write_loads_group_and_members_in_one_query():
+    session = MagicMock()
+    session.info = {}
+    expense = SimpleNamespace(id=22, group_id=3)
+    group = SimpleNamespace(id=3, owner_user_id=1)
+    session.execute.return_value.one_or_none.return_value = (expense, group, [1, 2])
+
+    result = expense_service._get_expense_for_write_or_404(expense_id=22, session=session)
+    expense_service._require_member(group_id=3, user_id=2, session=session)
+    owner_group = expense_service._get_group_or_404(group_id=3, session=session)
+
+    assert result is expense
+    assert owner_group is group
+    session.execute.assert_called_once()
+    sql = str(session.execute.call_args.args[0])
+    assert "JOIN groups ON groups.id = expenses.group_id" in sql
+    assert "array_agg(memberships.user_id)" in sql
+
+
+def test_get_expense_for_write_raises_when_missing():
+    session = MagicMock()
+    session.info = {}
+    session.execute.return_value.one_or_none.return_value = None
+
+    with pytest.raises(AppError) as exc_info:
+        expense_service._get_expense_for_write_or_404(expense_id=404, session=session)
+
+    assert exc_info.value.code == ErrorCode.EXPENSE_NOT_FOUND
+    assert exc_info.value.http_status == 404
+
+
 def test_require_member_passes_when_membership_exists():
     session = MagicMock()
-    session.execute.return_value.scalar_one_or_none.return_value = object()
+    session.info = {}
+    _mock_group_row(session, SimpleNamespace(id=1), [1, 2])
 
     expense_service._require_member(group_id=1, user_id=1, session=session)
 
@@ -77,7 +152,8 @@ def test_require_member_passes_when_membership_exists():
 
 def test_require_member_raises_forbidden_when_missing():
     session = MagicMock()
-    session.execute.return_value.scalar_one_or_none.return_value = None
+    session.info = {}
+    _mock_group_row(session, SimpleNamespace(id=1), [1, 2])
 
     with pytest.raises(AppError) as exc_info:
         expense_service._require_member(group_id=1, user_id=999, session=session)
@@ -87,14 +163,27 @@ def test_require_member_raises_forbidden_when_missing():
     assert err.http_status == 403
 
 
-def test_get_member_ids_reads_scalars():
+def test_get_member_ids_reads_aggregated_ids():
     session = MagicMock()
+    session.info = {}
     member_ids = [1, 2, 3]
-    _mock_scalars_all(session, member_ids)
+    _mock_group_row(session, SimpleNamespace(id=7), member_ids)
 
     result = expense_service._get_member_ids(group_id=7, session=session)
 
-    assert result == member_ids
+    assert result == frozenset(member_ids)
+    session.execute.assert_called_once()
+
+
+def test_group_and_membership_lookups_share_one_query_per_session():
+    session = MagicMock()
+    session.info = {}
+    _mock_group_row(session, SimpleNamespace(id=7), [1, 2])
+
+    expense_service._require_member(group_id=7, user_id=1, session=session)
+    expense_service._get_group_or_404(group_id=7, session=session)
+    expense_service._get_member_ids(group_id=7, session=session)
+
     session.execute.assert_called_once()
 
 
@@ -103,7 +192,7 @@ def test_validate_payer_is_member_raises_for_non_member():
         expense_service._validate_payer_is_member(
             paid_by_user_id=5,
             group_id=1,
-            member_ids=[1, 2, 3],
+            member_set=frozenset({1, 2, 3}),
         )
 
     err = exc_info.value
@@ -122,13 +211,31 @@ def test_validate_split_users_are_members_raises_on_first_invalid_user():
         expense_service._validate_split_users_are_members(
             splits=splits,
             group_id=1,
-            member_ids=[1, 2, 3],
+            member_set=frozenset({1, 2, 3}),
         )
 
     err = exc_info.value
     assert err.code == ErrorCode.SPLIT_USER_NOT_MEMBER
     assert err.http_status == 422
     assert err.field == "splits"
+    assert err.message == "User 9 is not a member of group 1."
+
+
+def test_validate_split_users_are_members_names_every_invalid_user():
+    splits = [
+        {"user_id": 9, "amount": Decimal("3.00")},
+        {"user_id": 1, "amount": Decimal("3.00")},
+        {"user_id": 7, "amount": Decimal("4.00")},
+    ]
+
+    with pytest.raises(AppError) as exc_info:
+        expense_service._validate_split_users_are_members(
+            splits=splits,
+            group_id=1,
+            member_set=frozenset({1, 2, 3}),
+        )
+
+    assert exc_info.value.message == "Users [7, 9] are not members of group 1."
 
 
 def test_compute_equal_splits_internal_error_branch(monkeypatch):
@@ -152,18 +259,30 @@ def test_compute_equal_splits_internal_error_branch(monkeypatch):
     assert err.http_status == 500
 
 
-def test_delete_splits_deletes_all_rows_and_flushes():
+def test_replace_splits_reconciles_with_delete_and_upsert():
     session = MagicMock()
-    expense = SimpleNamespace(splits=[SimpleNamespace(id=1), SimpleNamespace(id=2)])
+    expense = SimpleNamespace(id=5)
+    splits = [
+        {"user_id": 1, "amount": Decimal("4.00")},
+        {"user_id": 2, "amount": Decimal("6.00")},
+    ]
 
-    expense_service._delete_splits(expense=expense, session=session)
+    expense_service._replace_splits(expense=expense, splits_data=splits, session=session)
 
-    assert session.delete.call_count == 2
-    session.flush.assert_called_once()
+    assert session.execute.call_count == 2
+    delete_stmt, upsert_stmt = (c.args[0] for c in session.execute.call_args_list)
+    delete_sql = str(delete_stmt)
+    assert delete_sql.startswith("DELETE FROM splits WHERE splits.expense_id = ")
+    assert "splits.user_id NOT IN" in delete_sql
 
+    upsert_sql = str(upsert_stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT ON CONSTRAINT uq_splits_expense_user DO UPDATE" in upsert_sql
+    assert "SET amount = excluded.amount WHERE splits.amount != excluded.amount" in upsert_sql
+    session.delete.assert_not_called()
+    session.expire.assert_called_once_with(expense, ["splits"])
 
-@patch("backend.app.services.expense_service.Split")
-def test_create_split_rows_adds_split_models_and_flushes(mock_split_cls):
+
+def test_create_split_rows_bulk_inserts_in_one_statement():
     session = MagicMock()
     expense = SimpleNamespace(id=88)
     splits = [
@@ -173,13 +292,19 @@ def test_create_split_rows_adds_split_models_and_flushes(mock_split_cls):
 
     expense_service._create_split_rows(expense=expense, splits_data=splits, session=session)
 
-    assert session.add.call_count == 2
-    session.flush.assert_called_once()
+    session.execute.assert_called_once()
+    stmt, rows = session.execute.call_args.args
+    assert str(stmt).startswith("INSERT INTO splits")
+    assert rows == [
+        {"expense_id": 88, "user_id": 1, "amount": Decimal("4.00")},
+        {"expense_id": 88, "user_id": 2, "amount": Decimal("6.00")},
+    ]
+    session.add.assert_not_called()
 
 
 @patch("backend.app.services.expense_service._create_split_rows")
 @patch("backend.app.services.expense_service.Expense")
-@patch("backend.app.services.expense_service._get_member_ids", return_value=[1, 2])
+@patch("backend.app.services.expense_service._get_member_ids", return_value=frozenset({1, 2}))
 @patch("backend.app.services.expense_service._validate_payer_is_member")
 @patch("backend.app.services.expense_service._require_member")
 @patch("backend.app.services.expense_service._get_group_or_404")
@@ -221,7 +346,8 @@ def test_create_expense_equal_mode_success(
     assert expense.category == Category.FOOD
     session.add.assert_called()
     session.flush.assert_called()
-    session.refresh.assert_called_once_with(expense)
+    session.refresh.assert_not_called()
+    _assert_reloaded_for_response(session, expense)
     mock_create_split_rows.assert_called_once()
     mock_require_member.assert_called_once()
     mock_validate_payer.assert_called_once()
@@ -232,7 +358,7 @@ def test_create_expense_equal_mode_success(
 @patch("backend.app.services.expense_service.Expense")
 @patch("backend.app.services.expense_service._validate_split_sum")
 @patch("backend.app.services.expense_service._validate_split_users_are_members")
-@patch("backend.app.services.expense_service._get_member_ids", return_value=[1, 2])
+@patch("backend.app.services.expense_service._get_member_ids", return_value=frozenset({1, 2}))
 @patch("backend.app.services.expense_service._validate_payer_is_member")
 @patch("backend.app.services.expense_service._require_member")
 @patch("backend.app.services.expense_service._get_group_or_404")
@@ -277,7 +403,7 @@ def test_create_expense_custom_mode_success(
     assert expense.split_mode == SplitMode.CUSTOM
     assert expense.category == Category.OTHER  # default when missing in payload
     mock_create_split_rows.assert_called_once()
-    mock_validate_split_users.assert_called_once_with(custom_splits, 1, [1, 2])
+    mock_validate_split_users.assert_called_once_with(custom_splits, 1, frozenset({1, 2}))
     mock_validate_split_sum.assert_called_once_with(custom_splits, Decimal("10.00"), 1)
 
 
@@ -287,16 +413,42 @@ def test_list_expenses_returns_scalars(mock_get_group, mock_require_member):
     session = MagicMock()
     mock_get_group.return_value = SimpleNamespace(id=1)
     rows = [SimpleNamespace(id=11), SimpleNamespace(id=12)]
-    _mock_scalars_all(session, rows)
+    session.execute.return_value.scalars.return_value = iter(rows)
 
     result = expense_service.list_expenses(group_id=1, caller_id=1, session=session)
 
-    assert result == rows
+    assert list(result) == rows
     mock_get_group.assert_called_once()
     mock_require_member.assert_called_once()
     session.execute.assert_called_once()
 
 
+@patch("backend.app.services.expense_service._require_member")
+@patch("backend.app.services.expense_service._get_group_or_404")
+def test_list_expenses_eager_loads_payer_and_split_users(mock_get_group, mock_require_member):
+    session = MagicMock()
+    mock_get_group.return_value = SimpleNamespace(id=1)
+
+    expense_service.list_expenses(group_id=1, caller_id=1, session=session)
+
+    # The payer is joined into the main SELECT; splits come from a separate
+    # SELECT ... IN, so the expenses query itself has exactly one outer join.
+    sql = str(session.execute.call_args.args[0])
+    assert sql.count("LEFT OUTER JOIN users") == 1
+
+
+@patch("backend.app.services.expense_service._require_member")
+@patch("backend.app.services.expense_service._get_group_or_404")
+def test_list_expenses_streams_in_batches(mock_get_group, mock_require_member):
+    session = MagicMock()
+    mock_get_group.return_value = SimpleNamespace(id=1)
+
+    expense_service.list_expenses(group_id=1, caller_id=1, session=session)
+
+    stmt = session.execute.call_args.args[0]
+    assert stmt.get_execution_options()["yield_per"] == expense_service._LIST_BATCH_SIZE
+
+
 @patch("backend.app.services.expense_service._require_member")
 @patch("backend.app.services.expense_service._get_expense_or_404")
 def test_get_expense_requires_membership_and_returns_row(mock_get_expense_or_404, mock_require_member):
@@ -307,12 +459,14 @@ def test_get_expense_requires_membership_and_returns_row(mock_get_expense_or_404
     result = expense_service.get_expense(expense_id=22, caller_id=1, session=session)
 
     assert result is expense
-    mock_get_expense_or_404.assert_called_once_with(22, session)
+    mock_get_expense_or_404.assert_called_once_with(
+        22, session, options=expense_service._EXPENSE_READ_OPTIONS,
+    )
     mock_require_member.assert_called_once_with(3, 1, session)
 
 
 @patch("backend.app.services.expense_service._require_member")
-@patch("backend.app.services.expense_service._get_expense_or_404")
+@patch("backend.app.services.expense_service._get_expense_for_write_or_404")
 def test_edit_expense_rejects_deleted(mock_get_expense_or_404, mock_require_member):
     session = MagicMock()
     mock_get_expense_or_404.return_value = SimpleNamespace(
@@ -335,7 +489,7 @@ def test_edit_expense_rejects_deleted(mock_get_expense_or_404, mock_require_memb
 
 @patch("backend.app.services.expense_service._get_group_or_404")
 @patch("backend.app.services.expense_service._require_member")
-@patch("backend.app.services.expense_service._get_expense_or_404")
+@patch("backend.app.services.expense_service._get_expense_for_write_or_404")
 def test_edit_expense_forbidden_for_non_payer_non_owner(
     mock_get_expense_or_404,
     mock_require_member,
@@ -361,14 +515,13 @@ def test_edit_expense_forbidden_for_non_payer_non_owner(
     assert err.http_status == 403
 
 
-@patch("backend.app.services.expense_service._create_split_rows")
-@patch("backend.app.services.expense_service._delete_splits")
+@patch("backend.app.services.expense_service._replace_splits")
 @patch("backend.app.services.expense_service._compute_equal_splits")
-@patch("backend.app.services.expense_service._get_member_ids", return_value=[1, 2])
+@patch("backend.app.services.expense_service._get_member_ids", return_value=frozenset({1, 2}))
 @patch("backend.app.services.expense_service._validate_payer_is_member")
 @patch("backend.app.services.expense_service._get_group_or_404")
 @patch("backend.app.services.expense_service._require_member")
-@patch("backend.app.services.expense_service._get_expense_or_404")
+@patch("backend.app.services.expense_service._get_expense_for_write_or_404")
 def test_edit_expense_equal_mode_recomputes_and_updates_fields(
     mock_get_expense_or_404,
     mock_require_member,
@@ -376,8 +529,7 @@ def test_edit_expense_equal_mode_recomputes_and_updates_fields(
     mock_validate_payer,
     mock_get_member_ids,
     mock_compute_equal_splits,
-    mock_delete_splits,
-    mock_create_split_rows,
+    mock_replace_splits,
 ):
     session = MagicMock()
     expense = SimpleNamespace(
@@ -418,21 +570,22 @@ def test_edit_expense_equal_mode_recomputes_and_updates_fields(
     mock_validate_payer.assert_not_called()
     mock_get_member_ids.assert_called_once_with(1, session)
     mock_compute_equal_splits.assert_called_once_with(Decimal("12.00"), [1, 2], 1)
-    mock_delete_splits.assert_called_once_with(expense, session)
-    mock_create_split_rows.assert_called_once()
+    mock_replace_splits.assert_called_once_with(
+        expense, mock_compute_equal_splits.return_value, session,
+    )
     session.flush.assert_called_once()
-    session.refresh.assert_called_once_with(expense)
+    session.refresh.assert_not_called()
+    _assert_reloaded_for_response(session, expense)
 
 
-@patch("backend.app.services.expense_service._create_split_rows")
-@patch("backend.app.services.expense_service._delete_splits")
+@patch("backend.app.services.expense_service._replace_splits")
 @patch("backend.app.services.expense_service._validate_split_sum")
 @patch("backend.app.services.expense_service._validate_split_users_are_members")
-@patch("backend.app.services.expense_service._get_member_ids", return_value=[1, 2])
+@patch("backend.app.services.expense_service._get_member_ids", return_value=frozenset({1, 2}))
 @patch("backend.app.services.expense_service._validate_payer_is_member")
 @patch("backend.app.services.expense_service._get_group_or_404")
 @patch("backend.app.services.expense_service._require_member")
-@patch("backend.app.services.expense_service._get_expense_or_404")
+@patch("backend.app.services.expense_service._get_expense_for_write_or_404")
 def test_edit_expense_custom_revalidates_and_rewrites_splits(
     mock_get_expense_or_404,
     mock_require_member,
@@ -441,8 +594,7 @@ def test_edit_expense_custom_revalidates_and_rewrites_splits(
     mock_get_member_ids,
     mock_validate_split_users,
     mock_validate_split_sum,
-    mock_delete_splits,
-    mock_create_split_rows,
+    mock_replace_splits,
 ):
     session = MagicMock()
     expense = SimpleNamespace(
@@ -478,19 +630,92 @@ def test_edit_expense_custom_revalidates_and_rewrites_splits(
     assert expense.updated_at is not None
 
     assert mock_get_member_ids.call_count == 2
-    mock_validate_payer.assert_any_call(2, 1, [1, 2])
-    mock_validate_payer.assert_any_call(2, 1, [1, 2])
-    mock_validate_split_users.assert_called_once_with(new_splits, 1, [1, 2])
+    mock_validate_payer.assert_any_call(2, 1, frozenset({1, 2}))
+    mock_validate_split_users.assert_called_once_with(new_splits, 1, frozenset({1, 2}))
     mock_validate_split_sum.assert_called_once_with(new_splits, Decimal("12.00"), 1)
-    mock_delete_splits.assert_called_once_with(expense, session)
+    mock_replace_splits.assert_called_once_with(expense, new_splits, session)
+    session.flush.assert_called_once()
+    session.refresh.assert_not_called()
+    _assert_reloaded_for_response(session, expense)
+
+
+@patch("backend.app.services.expense_service.validate_stored_split_sum")
+@patch("backend.app.services.expense_service._create_split_rows")
+@patch("backend.app.services.expense_service._get_expense_or_404")
+def test_replace_expense_overwrites_fields_and_resplits(
+    mock_get_expense_or_404,
+    mock_create_split_rows,
+    mock_validate_stored_split_sum,
+):
+    session = MagicMock()
+    expense = SimpleNamespace(
+        id=1,
+        group_id=1,
+        paid_by_user_id=1,
+        amount=Decimal("10.00"),
+        category=Category.OTHER,
+        updated_at=None,
+    )
+    mock_get_expense_or_404.return_value = expense
+    new_splits = [{"user_id": 1, "amount": Decimal("12.00")}]
+
+    result = expense_service.replace_expense(
+        group_id=1,
+        expense_id=1,
+        caller_id=1,
+        data={"amount": Decimal("12.00"), "category": Category.FOOD, "splits": new_splits},
+        session=session,
+    )
+
+    assert result is expense
+    assert expense.amount == Decimal("12.00")
+    assert expense.category == Category.FOOD
+    assert expense.updated_at is not None
     mock_create_split_rows.assert_called_once_with(expense, new_splits, session)
+    mock_validate_stored_split_sum.assert_called_once_with(1, Decimal("12.00"), session)
     session.flush.assert_called_once()
-    session.refresh.assert_called_once_with(expense)
+    _assert_reloaded_for_response(session, expense)
+
+
+@patch("backend.app.services.expense_service.validate_stored_split_sum")
+@patch("backend.app.services.expense_service._create_split_rows")
+@patch("backend.app.services.expense_service._get_expense_or_404")
+def test_replace_expense_amount_only_rechecks_stored_splits(
+    mock_get_expense_or_404,
+    mock_create_split_rows,
+    mock_validate_stored_split_sum,
+):
+    session = MagicMock()
+    expense = SimpleNamespace(id=1, group_id=1, paid_by_user_id=1, amount=Decimal("10.00"))
+    mock_get_expense_or_404.return_value = expense
+
+    expense_service.replace_expense(
+        group_id=1, expense_id=1, caller_id=1,
+        data={"amount": Decimal("50.00")}, session=session,
+    )
+
+    mock_create_split_rows.assert_not_called()
+    mock_validate_stored_split_sum.assert_called_once_with(1, Decimal("50.00"), session)
+
+
+@patch("backend.app.services.expense_service._get_expense_or_404")
+def test_replace_expense_treats_other_group_as_not_found(mock_get_expense_or_404):
+    session = MagicMock()
+    mock_get_expense_or_404.return_value = SimpleNamespace(id=1, group_id=2, paid_by_user_id=1)
+
+    with pytest.raises(AppError) as exc_info:
+        expense_service.replace_expense(
+            group_id=1, expense_id=1, caller_id=1, data={}, session=session,
+        )
+
+    assert exc_info.value.code == ErrorCode.EXPENSE_NOT_FOUND
+    assert exc_info.value.http_status == 404
+    session.flush.assert_not_called()
 
 
 @patch("backend.app.services.expense_service._get_group_or_404")
 @patch("backend.app.services.expense_service._require_member")
-@patch("backend.app.services.expense_service._get_expense_or_404")
+@patch("backend.app.services.expense_service._get_expense_for_write_or_404")
 def test_delete_expense_sets_deleted_at_for_authorized_user(
     mock_get_expense_or_404,
     mock_require_member,
@@ -515,7 +740,7 @@ def test_delete_expense_sets_deleted_at_for_authorized_user(
 
 @patch("backend.app.services.expense_service._get_group_or_404")
 @patch("backend.app.services.expense_service._require_member")
-@patch("backend.app.services.expense_service._get_expense_or_404")
+@patch("backend.app.services.expense_service._get_expense_for_write_or_404")
 def test_delete_expense_idempotent_when_already_deleted(
     mock_get_expense_or_404,
     mock_require_member,
@@ -539,7 +764,7 @@ def test_delete_expense_idempotent_when_already_deleted(
 
 @patch("backend.app.services.expense_service._get_group_or_404")
 @patch("backend.app.services.expense_service._require_member")
-@patch("backend.app.services.expense_service._get_expense_or_404")
+@patch("backend.app.services.expense_service._get_expense_for_write_or_404")
 def test_delete_expense_forbidden_for_non_owner_non_payer(
     mock_get_expense_or_404,
     mock_require_member,
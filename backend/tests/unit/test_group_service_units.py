@@ -83,11 +83,25 @@ def test_list_groups_serializes_groups():
 
 
 @patch("backend.app.services.group_service._build_group_dict")
-@patch("backend.app.services.group_service._require_member")
+def test_create_group_adds_owner_membership_in_one_flush(mock_build_group_dict):
+    session = MagicMock()
+    owner = SimpleNamespace(id=10, username="alice", email="a@example.com")
+    session.get.return_value = owner
+
+    group_service.create_group(name="Trip", owner_id=10, session=session)
+
+    group = session.add.call_args.args[0]
+    assert group.name == "Trip"
+    assert [m.user_id for m in group.memberships] == [10]
+    session.add.assert_called_once()
+    session.flush.assert_called_once()
+    mock_build_group_dict.assert_called_once_with(group, [owner])
+
+
+@patch("backend.app.services.group_service._build_group_dict")
 @patch("backend.app.services.group_service._get_group_or_404")
 def test_get_group_returns_group_with_members(
     mock_get_group_or_404,
-    mock_require_member,
     mock_build_group_dict,
 ):
     session = MagicMock()
@@ -105,11 +119,25 @@ def test_get_group_returns_group_with_members(
 
     assert result == {"id": 11, "members": []}
     mock_get_group_or_404.assert_called_once_with(11, session)
-    mock_require_member.assert_called_once_with(11, 1, session)
     mock_build_group_dict.assert_called_once_with(group, members)
+    # The member list doubles as the INV-9 check — one query, not two.
     session.execute.assert_called_once()
 
 
+@patch("backend.app.services.group_service._get_group_or_404")
+def test_get_group_non_member_raises_forbidden(mock_get_group_or_404):
+    session = MagicMock()
+    _mock_scalars_all(session, [SimpleNamespace(id=1, username="alice", email="a@example.com")])
+    mock_get_group_or_404.return_value = SimpleNamespace(id=11)
+
+    with pytest.raises(AppError) as exc_info:
+        group_service.get_group(group_id=11, caller_id=99, session=session)
+
+    err = exc_info.value
+    assert err.code == ErrorCode.FORBIDDEN
+    assert err.http_status == 403
+
+
 @patch("backend.app.services.group_service._get_group_or_404")
 def test_add_member_non_owner_raises_forbidden(mock_get_group_or_404):
     session = MagicMock()
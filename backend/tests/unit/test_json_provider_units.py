@@ -0,0 +1,70 @@
+"""
+Unit tests for the orjson-backed JSON provider registered by create_app().
+
+Uses a bare Flask app with the provider attached — no config, database or
+blueprints are involved.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify, request
+
+from backend.app import OrjsonProvider
+from backend.app.models.expense import Category
+
+
+@pytest.fixture
+def app():
+    flask_app = Flask(__name__)
+    flask_app.json = OrjsonProvider(flask_app)
+    return flask_app
+
+
+def test_jsonify_emits_decimal_as_string(app):
+    with app.app_context():
+        response = jsonify({"amount": Decimal("10.50"), "category": Category.FOOD})
+
+    assert response.mimetype == "application/json"
+    assert response.get_data() == b'{"amount":"10.50","category":"food"}'
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2026, 10, 16, 8, 30, tzinfo=timezone.utc),
+        datetime(2026, 10, 16, 8, 30, 0, 123456, tzinfo=timezone.utc),
+    ],
+)
+def test_jsonify_emits_datetime_as_isoformat(app, value):
+    # Serializers hand datetimes to the provider instead of calling isoformat().
+    with app.app_context():
+        response = jsonify({"created_at": value})
+
+    assert response.get_json() == {"created_at": value.isoformat()}
+
+
+def test_get_json_parses_body_with_orjson(app):
+    with app.test_request_context(data=b'{"amount": "1.00", "ids": [1, 2]}'):
+        assert request.get_json(force=True) == {"amount": "1.00", "ids": [1, 2]}
+
+
+def test_malformed_body_with_silent_returns_none(app):
+    with app.test_request_context(data=b"{not json"):
+        assert request.get_json(force=True, silent=True) is None
+
+
+def test_get_json_hands_raw_bytes_to_orjson(app, monkeypatch):
+    # Flask passes request.get_data() to the provider undecoded, so orjson
+    # parses the body bytes directly — no UTF-8 decode to str first.
+    seen = []
+    real_loads = app.json.loads
+    monkeypatch.setattr(app.json, "loads", lambda s, **kw: seen.append(s) or real_loads(s))
+
+    with app.test_request_context(data=b'{"ids": [1]}'):
+        request.get_json(force=True)
+
+    assert seen == [b'{"ids": [1]}']
@@ -0,0 +1,60 @@
+"""
+Unit tests for model registration in the app factory.
+
+create_app() populates SQLAlchemy's MetaData through _ensure_models_loaded(),
+without pushing an application context. These tests prove the model modules
+register their tables with no Flask app or app context involved, plus a few
+model-level behaviours (hybrid attributes, repr, session options) that need
+no database either.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from backend.app import _ensure_models_loaded
+from backend.app.extensions import db
+from backend.app.models.expense import Expense
+
+
+def test_model_import_needs_no_app_context():
+    assert Expense.__tablename__ == "expenses"
+    assert "expenses" in db.metadata.tables
+
+
+def test_ensure_models_loaded_registers_every_table():
+    _ensure_models_loaded()
+    _ensure_models_loaded()  # idempotent — second call is a no-op
+
+    assert {
+        "users",
+        "groups",
+        "memberships",
+        "expenses",
+        "splits",
+        "settlements",
+        "refresh_tokens",
+    } <= set(db.metadata.tables)
+
+
+def test_expense_is_deleted_compiles_to_sql_predicate():
+    active = str(select(Expense.id).where(~Expense.is_deleted))
+    deleted = str(select(Expense.id).where(Expense.is_deleted))
+
+    assert "expenses.deleted_at IS NULL" in active
+    assert "expenses.deleted_at IS NOT NULL" in deleted
+
+
+def test_session_does_not_expire_on_commit():
+    # Routes serialize objects after commit(); see extensions.py.
+    assert db.session.session_factory.kw["expire_on_commit"] is False
+
+
+def test_repr_reads_only_loaded_state():
+    # A transient instance has nothing loaded beyond what was passed in;
+    # repr() must not reach for unloaded attributes.
+    expense = Expense(id=3, amount=Decimal("12.50"))
+
+    assert repr(expense) == "<Expense id=3 group_id=None amount=12.50 deleted=False>"
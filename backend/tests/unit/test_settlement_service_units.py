@@ -4,7 +4,7 @@ Unit tests for settlement_service branches not hit by current integration routes
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -26,3 +26,15 @@ def test_list_settlements_raises_group_not_found():
     err = exc_info.value
     assert err.code == ErrorCode.GROUP_NOT_FOUND
     assert err.http_status == 404
+
+
+@patch("backend.app.services.settlement_service._require_member")
+def test_list_settlements_joins_payer_and_recipient(mock_require_member):
+    session = MagicMock()
+    session.execute.return_value.scalars.return_value.all.return_value = []
+
+    settlement_service.list_settlements(group_id=1, caller_id=1, session=session)
+
+    sql = str(session.execute.call_args.args[0])
+    assert sql.count("LEFT OUTER JOIN users") == 2
+    mock_require_member.assert_called_once_with(1, 1, session)
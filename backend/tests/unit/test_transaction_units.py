@@ -0,0 +1,47 @@
+"""
+Unit tests for the @transactional route decorator.
+
+The request session is a MagicMock placed on flask.g inside a bare Flask
+request context; no database or app factory is involved.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask, g
+
+from backend.app.errors import AppError, ErrorCode
+from backend.app.middleware.transaction import transactional
+
+
+@pytest.fixture
+def session():
+    app = Flask(__name__)
+    with app.test_request_context():
+        g.db_session = MagicMock()
+        yield g.db_session
+
+
+def test_commits_once_after_view_returns(session):
+    @transactional
+    def view():
+        session.commit.assert_not_called()  # serialized before the commit
+        return "ok", 201
+
+    assert view() == ("ok", 201)
+    session.commit.assert_called_once()
+    session.rollback.assert_not_called()
+
+
+def test_rolls_back_and_reraises_app_error(session):
+    @transactional
+    def view():
+        raise AppError(ErrorCode.FORBIDDEN, "nope", 403)
+
+    with pytest.raises(AppError):
+        view()
+
+    session.rollback.assert_called_once()
+    session.commit.assert_not_called()
@@ -81,6 +81,11 @@ class TestRegisterSchema:
             self._load({"username": "alice smith", "email": "a@b.com", "password": "Secure1!"})
         assert "username" in exc.value.messages
 
+    def test_username_trailing_newline_raises(self):
+        with pytest.raises(ValidationError) as exc:
+            self._load({"username": "alice\n", "email": "a@b.com", "password": "Secure1!"})
+        assert "username" in exc.value.messages
+
     def test_username_exactly_3_chars_passes(self):
         """Boundary: min 3 chars."""
         result = self._load({"username": "abc", "email": "a@b.com", "password": "Secure1!"})
@@ -115,6 +120,11 @@ class TestRegisterSchema:
             self._load({"username": "alice", "email": "a@b.com", "password": "password"})
         assert "password" in exc.value.messages
 
+    def test_password_digits_before_letter_passes(self):
+        """Both classes are found in one scan regardless of order."""
+        result = self._load({"username": "alice", "email": "a@b.com", "password": "1234567a"})
+        assert result["username"] == "alice"
+
     def test_password_exactly_8_chars_passes(self):
         """Boundary: min 8 chars, 1 letter + 1 digit."""
         result = self._load({"username": "alice", "email": "a@b.com", "password": "Passw0rd"})
@@ -182,6 +192,12 @@ class TestRefreshTokenSchema:
             self._load({})
         assert "refresh_token" in exc.value.messages
 
+    def test_missing_field_message_is_error_code(self):
+        """Required fields report the MISSING_FIELD constant, not marshmallow's prose."""
+        with pytest.raises(ValidationError) as exc:
+            self._load({})
+        assert exc.value.messages["refresh_token"] == [ErrorCode.MISSING_FIELD]
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CreateGroupSchema
@@ -212,6 +228,11 @@ class TestCreateGroupSchema:
             self._load({"name": "   "})
         assert "name" in exc.value.messages
 
+    def test_leading_whitespace_with_content_passes(self):
+        """Only a fully blank value is rejected; padding alone is fine."""
+        result = self._load({"name": "  Trip"})
+        assert result["name"] == "  Trip"
+
     def test_name_exactly_100_chars_passes(self):
         """Boundary: max 100 chars."""
         result = self._load({"name": "a" * 100})
@@ -301,6 +322,13 @@ class TestSplitInputSchema:
         errors = exc.value.messages.get("amount", [])
         assert ErrorCode.INVALID_AMOUNT_PRECISION in errors
 
+    def test_trailing_zero_third_place_raises(self):
+        """INV-7 counts written places: "10.100" is 3 dp even though it equals 10.10."""
+        with pytest.raises(ValidationError) as exc:
+            self._load({"user_id": 1, "amount": "10.100"})
+        errors = exc.value.messages.get("amount", [])
+        assert ErrorCode.INVALID_AMOUNT_PRECISION in errors
+
     def test_missing_user_id_raises(self):
         with pytest.raises(ValidationError) as exc:
             self._load({"amount": "10.00"})
@@ -504,6 +532,27 @@ class TestCreateExpenseSchema:
         })
         assert isinstance(result["amount"], Decimal)
 
+    def test_reused_instance_builds_nested_split_schema_once(self):
+        """
+        Routes hold one schema instance per module. fields.Nested builds its
+        SplitInputSchema lazily and keeps it, so repeated loads through the
+        same instance must not rebuild the nested schema.
+        """
+        schema = CreateExpenseSchema()
+        payload = {
+            "paid_by_user_id": 1,
+            "description": "Dinner",
+            "amount": "10.00",
+            "split_mode": "custom",
+            "splits": [{"user_id": 1, "amount": "10.00"}],
+        }
+
+        schema.load(payload)
+        nested = schema.fields["splits"].inner.schema
+        schema.load(payload)
+
+        assert schema.fields["splits"].inner.schema is nested
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # PatchExpenseSchema
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+utils/bcrypt_cost.py — SplitLedger  ·  bcrypt Cost Benchmark
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Times bcrypt.hashpw on this machine for a range of cost factors and prints
+the largest one whose mean hash time fits the target latency. Run it on the
+deployment hardware and set the result as BCRYPT_LOG_ROUNDS in .env.
+
+Usage (run from project root):
+  python backend/utils/bcrypt_cost.py                  # target 250 ms
+  python backend/utils/bcrypt_cost.py --target-ms 500  # custom target
+  python backend/utils/bcrypt_cost.py --samples 5      # more samples per cost
+
+Requires:  pip install bcrypt
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import bcrypt
+
+_MIN_ROUNDS = 10
+_MAX_ROUNDS = 14
+
+
+def _mean_hash_ms(rounds: int, samples: int) -> float:
+    salt = bcrypt.gensalt(rounds=rounds)
+    start = time.perf_counter()
+    for _ in range(samples):
+        bcrypt.hashpw(b"benchmark-password", salt)
+    return (time.perf_counter() - start) * 1000 / samples
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float = 250,
+    samples: int = 3,
+    min_rounds: int = _MIN_ROUNDS,
+    max_rounds: int = _MAX_ROUNDS,
+) -> tuple[int, dict[int, float]]:
+    """
+    Returns (chosen_rounds, {rounds: mean_ms}).
+
+    Each extra round doubles the work, so timing stops at the first cost
+    that exceeds the target. If even min_rounds is too slow, min_rounds is
+    still returned — the cost never drops below that floor.
+    """
+    timings: dict[int, float] = {}
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        timings[rounds] = _mean_hash_ms(rounds, samples)
+        if timings[rounds] > target_ms:
+            break
+        chosen = rounds
+    return chosen, timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pick BCRYPT_LOG_ROUNDS for this machine.")
+    parser.add_argument("--target-ms", type=float, default=250, help="max mean hash time (default 250)")
+    parser.add_argument("--samples", type=int, default=3, help="hashes timed per cost (default 3)")
+    args = parser.parse_args()
+
+    chosen, timings = calibrate_bcrypt_rounds(args.target_ms, max(args.samples, 1))
+    for rounds, ms in timings.items():
+        marker = "  <-" if rounds == chosen else ""
+        print(f"  cost {rounds:>2}: {ms:8.1f} ms{marker}")
+    print(f"\nBCRYPT_LOG_ROUNDS={chosen}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
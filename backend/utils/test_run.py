@@ -466,7 +466,7 @@ _INVS = [
      "test_split_sum_invariant · test_expenses · test_expense_edit"),
     ("INV-2", "Σ(member balances) == 0.00 for every group",
      "balance_sum assertion → 500",
-     "test_compute_balances · test_balances"),
+     "test_balances"),
     ("INV-3", "Overpayment → warn but record  (pre-payment is valid)",
      "OVERPAYMENT warning · 201",
      "test_settlements"),